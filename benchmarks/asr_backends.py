@@ -0,0 +1,113 @@
+"""
+ASR backend benchmark: openai-whisper vs faster-whisper on CPU.
+
+Transcribes the same clips with every installed backend in ASR_BACKENDS and
+reports, per backend, the real-time factor (transcription time / audio
+duration, lower is faster) and the word error rate of its transcripts
+against the first backend's, as a measure of how closely the outputs agree.
+
+Clips come from --clips DIR (any format PyAV can decode: pip install av);
+without it a few seconds of synthetic tones and noise are generated. Those
+are enough to time the backends, but agreement only means something on real
+speech, so point --clips at a folder of downloaded shorts for that.
+
+Usage:
+    python benchmarks/asr_backends.py
+    python benchmarks/asr_backends.py --clips ./sample_clips --model small --threads 4
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from youtube_shorts_free import (  # noqa: E402
+    ASR_BACKENDS, asr_installed, decode_audio, load_asr_backend)
+
+SAMPLE_RATE = 16000
+
+
+def synthetic_clips(count=3, seconds=15):
+    """Tone-and-noise clips with speech-like on/off envelopes, as (name, audio) pairs."""
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    t = np.arange(SAMPLE_RATE * seconds) / SAMPLE_RATE
+    clips = []
+    for i in range(count):
+        envelope = np.repeat(rng.random(seconds * 4) > 0.3, SAMPLE_RATE // 4)
+        harmonics = enumerate((180 + 40 * i, 360, 540), 1)
+        voice = sum(np.sin(2 * np.pi * f * t) / k for k, f in harmonics)
+        audio = 0.2 * voice * envelope + 0.01 * rng.standard_normal(len(t))
+        clips.append((f"synthetic-{i}", audio.astype(np.float32)))
+    return clips
+
+
+def load_clips(directory):
+    clips = []
+    for path in sorted(glob.glob(os.path.join(directory, "*"))):
+        audio = decode_audio(path)
+        if audio is None:
+            sys.exit("Decoding clips needs PyAV: pip install av")
+        clips.append((os.path.basename(path), audio))
+    return clips
+
+
+def word_error_rate(reference, hypothesis):
+    """Word-level Levenshtein distance over the reference length (case and punctuation ignored)."""
+    ref = re.findall(r"\w+", reference.lower())
+    hyp = re.findall(r"\w+", hypothesis.lower())
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, word in enumerate(ref, 1):
+        current = [i]
+        for j, other in enumerate(hyp, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (word != other)))
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare ASR backends' speed and agreement")
+    parser.add_argument("--clips", metavar="DIR",
+                        help="Folder of audio clips (default: synthetic tones)")
+    parser.add_argument("--model", default="base",
+                        help="Model name passed to every backend (default: base)")
+    parser.add_argument("--threads", type=int, default=None,
+                        help="CPU threads per backend (default: backend default)")
+    parser.add_argument("--language", default=None,
+                        help="Language hint passed to every backend (default: detect per clip)")
+    args = parser.parse_args()
+
+    clips = load_clips(args.clips) if args.clips else synthetic_clips()
+    if not clips:
+        sys.exit(f"No clips found in {args.clips}")
+    duration = sum(len(audio) for _, audio in clips) / SAMPLE_RATE
+    backends = [name for name in ASR_BACKENDS if asr_installed(name)]
+    if not backends:
+        sys.exit("No ASR backend installed: pip install " + " ".join(ASR_BACKENDS))
+    print(f"{len(clips)} clips, {duration:.1f} s of audio, model '{args.model}'\n")
+
+    transcripts = {}
+    for name in backends:
+        model = load_asr_backend(name, args.model, args.threads)
+        # Warm up so model loading and first-call setup are not timed
+        model.transcribe(clips[0][1], args.language)
+        start = time.perf_counter()
+        transcripts[name] = [model.transcribe(audio, args.language)[0] for _, audio in clips]
+        rtf = (time.perf_counter() - start) / duration
+        reference = backends[0]
+        wer = sum(word_error_rate(ref, hyp) for ref, hyp in
+                  zip(transcripts[reference], transcripts[name])) / len(clips)
+        agreement = "reference" if name == reference else f"WER vs {reference} {wer:6.1%}"
+        print(f"  {name:<15} RTF {rtf:6.3f}  {agreement}")
+        del model
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Caption connection pooling benchmark.
+
+Serves canned caption responses from a local http.server stub and times the
+same number of GET requests sent two ways:
+  pooled  - the keep-alive requests.Session owned by CaptionFetcher
+  fresh   - a new requests.Session (and so a new connection) per request,
+            like the static YouTubeTranscriptApi helpers
+
+The stub sleeps --connect-delay ms when it accepts a connection, standing in
+for the TCP + TLS handshake to youtube.com that pooling saves.
+
+Usage:
+    python benchmarks/caption_pool.py
+    python benchmarks/caption_pool.py --requests 500 --workers 8 --connect-delay 50
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from youtube_shorts_free import CaptionFetcher  # noqa: E402
+
+# A short transcript's worth of timedtext XML
+CAPTION_BODY = ("<transcript>"
+                + "".join(f'<text start="{i}" dur="1.5">line {i}</text>' for i in range(40))
+                + "</transcript>").encode()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler answering every GET with CAPTION_BODY."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY every
+    # keep-alive response would wait out the client's delayed ACK
+    disable_nagle_algorithm = True
+    connect_delay = 0.0
+    connections = 0
+    _lock = threading.Lock()
+
+    def setup(self):
+        # Runs once per accepted connection, not per request
+        with _StubHandler._lock:
+            _StubHandler.connections += 1
+        time.sleep(self.connect_delay)
+        super().setup()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(CAPTION_BODY)))
+        self.end_headers()
+        self.wfile.write(CAPTION_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _run(get, url, count, workers):
+    """Send `count` GETs through `get(url)` from `workers` threads; return seconds taken."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for response in executor.map(get, [url] * count):
+            assert response.status_code == 200 and response.content == CAPTION_BODY
+    return time.perf_counter() - start
+
+
+def _fresh_get(url):
+    with requests.Session() as session:
+        return session.get(url)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare pooled vs per-request caption sessions")
+    parser.add_argument("--requests", type=int, default=200,
+                        help="Requests per mode (default: 200)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Concurrent caption workers (default: 4)")
+    parser.add_argument("--connect-delay", type=float, default=20.0, metavar="MS",
+                        help="Simulated handshake cost per new connection (default: 20)")
+    args = parser.parse_args()
+
+    _StubHandler.connect_delay = args.connect_delay / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/timedtext"
+
+    fetcher = CaptionFetcher(pool_size=args.workers)
+    modes = [("pooled", fetcher.session.get), ("fresh", _fresh_get)]
+    print(f"{args.requests} requests, {args.workers} workers, "
+          f"{args.connect_delay:g} ms per new connection\n")
+    try:
+        for name, get in modes:
+            _StubHandler.connections = 0
+            elapsed = _run(get, url, args.requests, args.workers)
+            print(f"  {name:<7} {elapsed:7.2f} s  {args.requests / elapsed:8.1f} req/s  "
+                  f"{_StubHandler.connections:5d} connections")
+    finally:
+        fetcher.session.close()
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+YoutubeDL pooling benchmark.
+
+Times the per-video overhead of the metadata lookup done two ways:
+  fresh   - a new yt_dlp.YoutubeDL per video, as before YdlSession
+  pooled  - YoutubeDL instances lent out by YdlSession.borrow
+
+extract_info is replaced by a stub returning canned metadata, so no request
+leaves the machine and only the YoutubeDL setup (extractor registry, HTTP
+opener, cookie jar) differs between the two modes.
+
+Usage:
+    python benchmarks/ydl_pool.py
+    python benchmarks/ydl_pool.py --videos 500 --workers 8
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import yt_dlp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from youtube_shorts_free import YdlSession, _ydl_base_opts  # noqa: E402
+
+
+def _stub_extract_info(self, url, download=True, process=True, **kwargs):
+    video_id = url.rsplit("/", 1)[-1]
+    return {"id": video_id, "title": f"Short {video_id}", "view_count": 1000,
+            "like_count": 50, "upload_date": "20250101"}
+
+
+def _fresh(url, opts):
+    with yt_dlp.YoutubeDL(opts) as ydl:
+        return ydl.extract_info(url, download=False)
+
+
+def _run(lookup, count, workers):
+    """Look up `count` videos through `lookup(url)` from `workers` threads; return seconds."""
+    urls = [f"https://www.youtube.com/shorts/bench{i:06d}" for i in range(count)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for info in executor.map(lookup, urls):
+            assert info["title"].startswith("Short ")
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare fresh vs pooled YoutubeDL instances")
+    parser.add_argument("--videos", type=int, default=200,
+                        help="Lookups per mode (default: 200)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Concurrent metadata workers (default: 4)")
+    args = parser.parse_args()
+
+    yt_dlp.YoutubeDL.extract_info = _stub_extract_info
+    opts = {**_ydl_base_opts(), "skip_download": True}
+
+    session = YdlSession(args.workers)
+
+    def pooled(url):
+        with session.borrow("metadata", opts) as ydl:
+            return ydl.extract_info(url, download=False)
+
+    modes = [("fresh", lambda url: _fresh(url, opts)), ("pooled", pooled)]
+    print(f"{args.videos} lookups, {args.workers} workers, yt-dlp {yt_dlp.version.__version__}\n")
+    try:
+        for name, lookup in modes:
+            elapsed = _run(lookup, args.videos, args.workers)
+            print(f"  {name:<7} {elapsed:7.2f} s  {elapsed * 1000 / args.videos:8.2f} ms/video")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
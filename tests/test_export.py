@@ -0,0 +1,37 @@
+"""export_data replaces the output file only once the new JSON is fully written."""
+
+import json
+import os
+import sys
+
+import pytest
+
+for dependency in ("scrapetube", "yt_dlp", "requests", "youtube_transcript_api"):
+    pytest.importorskip(dependency)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import youtube_shorts_free as collector  # noqa: E402
+
+ROW = {"title": "Short", "views": 10, "likes": 1, "release_date": "2025-01-01",
+       "video_url": "https://www.youtube.com/shorts/vid000", "transcript": "hello"}
+
+
+def test_export_writes_rows(tmp_path):
+    output = tmp_path / "shorts.json"
+    collector.export_data([ROW], str(output))
+    assert json.loads(output.read_text(encoding="utf-8")) == [ROW]
+    assert os.listdir(tmp_path) == ["shorts.json"]
+
+
+def test_failed_export_keeps_previous_file(tmp_path, monkeypatch):
+    output = tmp_path / "shorts.json"
+    collector.export_data([ROW], str(output))
+
+    def crash(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(collector.json, "dump", crash)
+    with pytest.raises(KeyboardInterrupt):
+        collector.export_data([ROW, ROW], str(output))
+    assert json.loads(output.read_text(encoding="utf-8")) == [ROW]
+    assert os.listdir(tmp_path) == ["shorts.json"]
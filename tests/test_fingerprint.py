@@ -0,0 +1,75 @@
+"""audio_fingerprint / fingerprints_match / FingerprintIndex on synthetic clips."""
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+for dependency in ("scrapetube", "yt_dlp", "requests", "youtube_transcript_api"):
+    pytest.importorskip(dependency)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import youtube_shorts_free as collector  # noqa: E402
+
+RATE = 16000
+SECONDS = 20
+
+
+def _clip(seed):
+    """Noise bursts over a wandering tone: broadband, time-varying, like a short's audio."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(RATE * SECONDS) / RATE
+    bursts = np.repeat(rng.random(SECONDS * 10), RATE // 10)
+    swells = np.repeat(rng.random(SECONDS * 2), RATE // 2)
+    tone = np.sin(2 * np.pi * rng.uniform(200, 900) * t) * swells
+    return (0.1 * rng.standard_normal(len(t)) * bursts + 0.2 * tone).astype(np.float32)
+
+
+def _reupload(audio, offset=0, seed=99):
+    """Quieter, slightly noisy copy with `offset` samples cut from the start."""
+    rng = np.random.default_rng(seed)
+    noise = 0.01 * rng.standard_normal(len(audio) - offset)
+    return (0.5 * audio[offset:] + noise).astype(np.float32)
+
+
+@pytest.fixture
+def original():
+    return _clip(1)
+
+
+@pytest.mark.parametrize("offset", [0, 1600, 4800])
+def test_reencoded_and_shifted_copies_match(original, offset):
+    copy = collector.audio_fingerprint(_reupload(original, offset))
+    assert collector.fingerprints_match(collector.audio_fingerprint(original), copy)
+
+
+@pytest.mark.parametrize("seed", [2, 3, 4])
+def test_unrelated_clips_do_not_match(original, seed):
+    assert not collector.fingerprints_match(collector.audio_fingerprint(original),
+                                            collector.audio_fingerprint(_clip(seed)))
+
+
+def test_clips_under_a_second_have_no_fingerprint():
+    assert collector.audio_fingerprint(np.zeros(RATE // 2, dtype=np.float32)) is None
+
+
+def test_index_finds_the_original_among_unrelated_clips(original, tmp_path):
+    index = collector.FingerprintIndex(str(tmp_path / "cache.db"))
+    for seed in range(2, 6):
+        index.put(f"other{seed}", SECONDS, collector.audio_fingerprint(_clip(seed)))
+    index.put("original", SECONDS, collector.audio_fingerprint(original))
+
+    copy = _reupload(original, 1600)
+    assert index.match("copy", len(copy) / RATE, collector.audio_fingerprint(copy)) == "original"
+    noise = np.random.default_rng(7).standard_normal(RATE * SECONDS).astype(np.float32)
+    assert index.match("noise", SECONDS, collector.audio_fingerprint(noise)) is None
+
+
+def test_put_replaces_a_clips_words(tmp_path):
+    index = collector.FingerprintIndex(str(tmp_path / "cache.db"))
+    index.put("clip", SECONDS, collector.audio_fingerprint(_clip(1)))
+    index.put("clip", SECONDS, collector.audio_fingerprint(_clip(2)))
+    words = index._conn.execute("SELECT COUNT(*) FROM fingerprint_words").fetchone()[0]
+    assert words == len(collector.FingerprintIndex._words(collector.audio_fingerprint(_clip(2)),
+                                                          collector.FingerprintIndex.WORD_STRIDE))
@@ -0,0 +1,34 @@
+"""Importing the collector must not pull in Whisper or torch (seconds of startup)."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+for dependency in ("scrapetube", "yt_dlp", "requests", "youtube_transcript_api"):
+    pytest.importorskip(dependency)
+
+
+def _imported_modules(module):
+    """Names of every module imported by `import module`, from -X importtime."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=REPO, capture_output=True, text=True, check=True)
+    names = []
+    for line in result.stderr.splitlines():
+        # "import time:       self [us] |  cumulative | imported package"
+        if line.startswith("import time:") and "|" in line:
+            name = line.rsplit("|", 1)[1].strip()
+            if name != "imported package":
+                names.append(name)
+    return names
+
+
+def test_import_skips_whisper_and_torch():
+    names = _imported_modules("youtube_shorts_free")
+    assert "youtube_shorts_free" in names
+    heavy = [name for name in names
+             if name.split(".")[0] in ("whisper", "faster_whisper", "torch", "ctranslate2")]
+    assert heavy == []
@@ -0,0 +1,69 @@
+"""WhisperScheduler when an ASR worker process dies mid-run."""
+
+import os
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+for dependency in ("scrapetube", "yt_dlp", "requests", "youtube_transcript_api"):
+    pytest.importorskip(dependency)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import youtube_shorts_free as collector  # noqa: E402
+
+CLIPS = [(f"vid{i}", f"/tmp/vid{i}.mp3") for i in range(4)]
+
+
+class _Prefetcher:
+    saturated = False
+
+    def __init__(self):
+        self.deleted = []
+
+    def __iter__(self):
+        return iter(CLIPS)
+
+    def done(self, audio_path):
+        self.deleted.append(audio_path)
+
+
+class _BrokenPool:
+    """Fails its first job the way a pool whose worker was OOM-killed does."""
+
+    def __init__(self):
+        self.jobs = 0
+
+    def submit(self, fn, *args):
+        self.jobs += 1
+        if self.jobs > 1:
+            raise BrokenProcessPool("pool is broken")
+        future = Future()
+        future.set_exception(BrokenProcessPool("a worker process died"))
+        return future
+
+
+def _transcribe(audio_paths, language=None, audios=None):
+    return [(f"text of {os.path.basename(path)}", [], "en") for path in audio_paths]
+
+
+def _scheduler(fallback):
+    prefetcher = _Prefetcher()
+    scheduler = collector.WhisperScheduler(_BrokenPool(), _transcribe, prefetcher, "test",
+                                           asr_workers=2, fallback=fallback)
+    return scheduler, prefetcher
+
+
+def test_broken_pool_falls_back_to_in_process():
+    scheduler, prefetcher = _scheduler(lambda: (ThreadPoolExecutor(max_workers=1), _transcribe))
+    results = scheduler.run(len(CLIPS))
+    assert results == {video_id: f"text of {video_id}.mp3" for video_id, _ in CLIPS}
+    assert sorted(prefetcher.deleted) == sorted(path for _, path in CLIPS)
+
+
+def test_broken_pool_without_fallback_leaves_clips_untranscribed(capsys):
+    scheduler, prefetcher = _scheduler(None)
+    assert scheduler.run(len(CLIPS)) == {}
+    assert sorted(prefetcher.deleted) == sorted(path for _, path in CLIPS)
+    assert capsys.readouterr().out.count("Could not transcribe") == len(CLIPS)
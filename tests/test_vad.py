@@ -0,0 +1,63 @@
+"""trim_silence on short, silent and voiced clips, and the --vad fallback without PyAV."""
+
+import os
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+for dependency in ("scrapetube", "yt_dlp", "requests", "youtube_transcript_api"):
+    pytest.importorskip(dependency)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import youtube_shorts_free as collector  # noqa: E402
+
+RATE = 16000
+
+
+def _tone(seconds, amplitude=0.3):
+    t = np.arange(int(RATE * seconds)) / RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds):
+    return np.zeros(int(RATE * seconds), dtype=np.float32)
+
+
+@pytest.fixture(autouse=True)
+def energy_vad(monkeypatch):
+    # A pure tone is not speech to webrtcvad; test the energy threshold instead
+    monkeypatch.setitem(sys.modules, "webrtcvad", None)
+
+
+def test_silent_clip_has_no_speech():
+    assert collector.trim_silence(_silence(2)) is None
+
+
+def test_clip_shorter_than_padding_window_is_kept():
+    # 400 ms = 13 frames, fewer than the 21-frame padding kernel
+    audio, kept = collector.trim_silence(_tone(0.4))
+    assert len(audio) == 13 * 480
+    assert len(kept) == 13
+
+
+def test_voiced_clip_is_trimmed_to_speech_and_padding():
+    clip = np.concatenate([_silence(1), _tone(1), _silence(1)])
+    audio, kept = collector.trim_silence(clip)
+    # One second of speech plus up to 300 ms of padding either side
+    assert RATE <= len(audio) <= 1.7 * RATE
+    assert kept[0] == pytest.approx(0.69, abs=0.03)
+    assert kept[-1] == pytest.approx(2.28, abs=0.03)
+
+
+def test_too_little_speech_is_dropped():
+    clip = np.concatenate([_silence(1), _tone(0.1), _silence(1)])
+    assert collector.trim_silence(clip) is None
+
+
+def test_vad_without_pyav_warns_once(monkeypatch, capsys):
+    monkeypatch.setattr(collector, "decode_audio", lambda path: None)
+    monkeypatch.setattr(collector, "_vad_warned", False)
+    assert collector._prepare_audio("a.mp3", vad=True) == ("a.mp3", None)
+    assert collector._prepare_audio("b.mp3", vad=True) == ("b.mp3", None)
+    assert capsys.readouterr().out.count("--vad needs PyAV") == 1
@@ -16,15 +16,37 @@ Dependencies:
 Optional (for Whisper fallback when no captions exist):
     pip install openai-whisper
     Also requires ffmpeg on PATH: https://ffmpeg.org/download.html
+    pip install av    (optional: decodes audio in-process instead of via ffmpeg)
 """
 
 import argparse
+import functools
+import glob
+import http.client
+import importlib.util
+import ipaddress
+import itertools
 import json
+import multiprocessing
 import os
+import queue
+import random
+import re
+import socket
+import sqlite3
+import ssl
 import sys
 import tempfile
+import threading
 import time
+import urllib.error
+import urllib.request
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
 
 try:
     import scrapetube
@@ -41,42 +63,590 @@ except ImportError:
     sys.exit(1)
 
 try:
-    from youtube_transcript_api import YouTubeTranscriptApi
+    import requests
+    import youtube_transcript_api
+    from requests.adapters import HTTPAdapter
+    from youtube_transcript_api import NoTranscriptFound, YouTubeTranscriptApi
 except ImportError:
     print("Missing dependency: youtube-transcript-api")
     print("  pip install youtube-transcript-api")
     sys.exit(1)
 
-# Whisper is optional — only needed as fallback when captions are missing
-try:
-    import whisper as openai_whisper
-    WHISPER_AVAILABLE = True
-except ImportError:
-    WHISPER_AVAILABLE = False
+# Whisper is optional — only needed as fallback when captions are missing.
+# It pulls in torch, so it is imported only when Phase 2 loads a model
+# (see load_asr_backend; asr_installed checks for it without importing).
 
 
 # ---------------------------------------------------------------------------
 # Step 1: List all shorts from a channel
 # ---------------------------------------------------------------------------
 
-def list_shorts(channel_url):
-    """Use scrapetube to get all video IDs from the channel's Shorts tab."""
-    print(f"[{_ts()}] Listing shorts from channel...")
+def _renderer_text(node):
+    """Flatten a YouTube renderer text node ({simpleText}, {runs} or {content})."""
+    if not isinstance(node, dict):
+        return None
+    if "simpleText" in node:
+        return node["simpleText"]
+    if "runs" in node:
+        return "".join(run.get("text", "") for run in node["runs"])
+    return node.get("content")
+
+
+def _parse_count(text):
+    """Turn listing text like '1.2M views' or '12,345 views' into an int."""
+    if not text:
+        return None
+    match = re.search(r"([\d.,]+)\s*([KMB])?", text.replace("\u00a0", " "), re.IGNORECASE)
+    if not match:
+        # "No views"
+        return 0 if "no " in text.lower() else None
+    number, suffix = match.groups()
+    multiplier = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000}.get((suffix or "").upper(), 1)
+    try:
+        if suffix:
+            return int(float(number.replace(",", ".")) * multiplier)
+        return int(number.replace(",", "").replace(".", ""))
+    except ValueError:
+        return None
+
+
+def parse_listing_metadata(video):
+    """Extract the title and (approximate) view count a Shorts renderer already carries."""
+    overlay = video.get("overlayMetadata", {})
+    title = _renderer_text(video.get("headline")) or _renderer_text(overlay.get("primaryText"))
+    views_text = (_renderer_text(video.get("viewCountText"))
+                  or _renderer_text(overlay.get("secondaryText")))
+    return {"title": title, "views": _parse_count(views_text)}
 
+
+def iter_shorts(channel_url, stop_at=None, listing=None):
+    """Yield video IDs from the channel's Shorts tab as scrapetube pages through it.
+
+    The tab is ordered newest first, so when `stop_at` (a set of already
+    collected IDs) is given, enumeration stops at the first known ID and no
+    further pages are requested. If a `listing` dict is passed, the title and
+    view count found in each renderer are stored in it by video ID.
+    """
     # scrapetube expects the channel URL or handle
     # It supports content_type="shorts" to filter for shorts only
     videos = scrapetube.get_channel(channel_url=channel_url, content_type="shorts")
 
-    video_ids = []
     for video in videos:
         video_id = video.get("videoId")
+        if stop_at and video_id in stop_at:
+            return
         if video_id:
-            video_ids.append(video_id)
+            if listing is not None:
+                listing[video_id] = parse_listing_metadata(video)
+            yield video_id
+
+
+def list_shorts(channel_url, stop_at=None, listing=None):
+    """Use scrapetube to get all video IDs from the channel's Shorts tab."""
+    print(f"[{_ts()}] Listing shorts from channel...")
+
+    video_ids = list(iter_shorts(channel_url, stop_at, listing))
 
     print(f"  Found {len(video_ids)} shorts")
     return video_ids
 
 
+# ---------------------------------------------------------------------------
+# Rate limiting and retries shared by all network steps
+# ---------------------------------------------------------------------------
+
+# Starting request rates (requests/second) per endpoint class
+DEFAULT_RATES = {"metadata": 2.0, "captions": 3.0, "audio": 1.0}
+
+# Error classes (see classify_error); only these are worth retrying
+RETRYABLE_ERRORS = ("network", "throttled")
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 2.0
+
+# Throttling responses: `_report` halves the endpoint's rate on these
+THROTTLE_ERRORS = ("throttled", "bot_check")
+
+# Exception types that mean the request never got a usable HTTP answer
+_NETWORK_ERRORS = (ConnectionError, TimeoutError, socket.timeout, http.client.IncompleteRead,
+                   ssl.SSLError, urllib.error.URLError, requests.ConnectionError, requests.Timeout)
+try:
+    from yt_dlp.networking.exceptions import TransportError
+    _NETWORK_ERRORS += (TransportError,)
+except ImportError:  # yt-dlp before 2023.11 wraps urllib errors instead
+    pass
+
+# youtube-transcript-api exception classes by error class; names vary between
+# releases, so only the ones the installed version defines are used
+_CAPTION_ERRORS = [
+    ("throttled", tuple(getattr(youtube_transcript_api, name)
+                        for name in ("TooManyRequests", "RequestBlocked", "IpBlocked")
+                        if hasattr(youtube_transcript_api, name))),
+    ("unavailable", tuple(getattr(youtube_transcript_api, name)
+                          for name in ("VideoUnavailable", "AgeRestricted")
+                          if hasattr(youtube_transcript_api, name))),
+]
+
+# Last resort for errors that only carry a message: lower-cased fragments,
+# checked in order against the text after yt-dlp's "[extractor] ID:" prefix
+_ERROR_PATTERNS = [
+    ("throttled", ("http error 429", "status code 429", "too many requests")),
+    ("bot_check", ("sign in to confirm", "not a bot", "captcha")),
+    ("unavailable", ("private video", "video unavailable", "has been removed",
+                     "video is not available", "members-only", "account associated",
+                     "no longer available")),
+    ("network", ("timed out", "temporary failure", "network is unreachable",
+                 "connection refused", "connection reset", "connection aborted",
+                 "remote end closed", "incompleteread", "http error 5")),
+]
+_MESSAGE_PREFIX = re.compile(r"^(?:error:\s*)?\[[^\]]+\]\s*[\w-]+:\s*")
+_URL = re.compile(r"https?://\S+")
+
+class RateLimiter:
+    """Adaptive token bucket for one endpoint class, safe to share across threads.
+
+    The rate creeps up by 5% of the starting rate after every successful
+    request (up to 4x the starting rate) and is halved whenever YouTube
+    answers with a throttling response (down to a tenth of the starting rate).
+    """
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.min_rate = rate / 10
+        self.max_rate = rate * 4
+        self._step = rate * 0.05
+        self._capacity = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def success(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self._step)
+
+    def throttled(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            # Drain the bucket so every worker pauses before the next request
+            self._tokens = min(self._tokens, 0)
+
+
+def build_rate_limits(metadata=None, captions=None, audio=None):
+    """Return one RateLimiter per endpoint class, defaulting to DEFAULT_RATES."""
+    rates = {"metadata": metadata, "captions": captions, "audio": audio}
+    return {kind: RateLimiter(rate or DEFAULT_RATES[kind]) for kind, rate in rates.items()}
+
+
+def _error_chain(error):
+    """Yield `error` and the exceptions it wraps (yt-dlp's exc_info, then __cause__)."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        yield error
+        exc_info = getattr(error, "exc_info", None)
+        wrapped = exc_info[1] if isinstance(exc_info, tuple) and len(exc_info) > 1 else None
+        error = wrapped or error.__cause__ or error.__context__
+
+
+def _status_code(error):
+    """HTTP status of a urllib / yt-dlp / requests HTTP error, or None."""
+    response = getattr(error, "response", None)
+    for value in (getattr(error, "status", None), getattr(error, "code", None),
+                  getattr(response, "status_code", None), getattr(response, "status", None)):
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def classify_error(error):
+    """Classify a yt-dlp / caption exception.
+
+    Returns "throttled", "bot_check", "unavailable" (private or removed),
+    "network" or "unknown". Status codes and exception types decide first;
+    the message is only consulted when neither does.
+    """
+    for exc in _error_chain(error):
+        status = _status_code(exc)
+        if status == 429:
+            return "throttled"
+        if status is not None and status >= 500:
+            return "network"
+        for kind, types in _CAPTION_ERRORS:
+            if types and isinstance(exc, types):
+                return kind
+        if status is None and isinstance(exc, _NETWORK_ERRORS):
+            return "network"
+    # The video ID and URLs are random text ("ab429cdEfgh"), keep them out of the match
+    message = _URL.sub("", _MESSAGE_PREFIX.sub("", str(error).lower()))
+    for kind, fragments in _ERROR_PATTERNS:
+        if any(fragment in message for fragment in fragments):
+            return kind
+    return "unknown"
+
+
+def _report(limiter, error=None):
+    """Feed the outcome of a request back into its rate limiter."""
+    if limiter is None:
+        return
+    if error is None:
+        limiter.success()
+    elif classify_error(error) in THROTTLE_ERRORS:
+        limiter.throttled()
+
+
+def _with_retries(call, limiter=None, retries=MAX_RETRIES):
+    """Run `call()` paced by `limiter`, retrying transient failures.
+
+    Network errors and throttling are retried up to `retries` times with
+    jittered exponential backoff; any other error is raised immediately.
+    """
+    for attempt in range(retries + 1):
+        if limiter:
+            limiter.acquire()
+        try:
+            result = call()
+        except Exception as e:
+            _report(limiter, e)
+            if attempt == retries or classify_error(e) not in RETRYABLE_ERRORS:
+                raise
+            time.sleep(RETRY_BASE_DELAY * 2 ** attempt * random.uniform(0.5, 1.5))
+            continue
+        _report(limiter)
+        return result
+
+
+# ---------------------------------------------------------------------------
+# Persistent local cache
+# ---------------------------------------------------------------------------
+
+DEFAULT_CACHE_DB = "shorts_cache.db"
+
+
+class _SqliteStore:
+    """One table in the shared cache database, usable from any worker thread."""
+
+    SCHEMA = ""
+
+    def __init__(self, path=DEFAULT_CACHE_DB):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(self.SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class MetadataCache(_SqliteStore):
+    """SQLite cache of per-video metadata, shared by all worker threads.
+
+    Immutable fields (title, release_date) and volatile fields (views, likes)
+    are timestamped separately, so each group expires on its own TTL.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS metadata ("
+        " video_id TEXT PRIMARY KEY,"
+        " title TEXT, release_date TEXT, static_at REAL,"
+        " views INTEGER, likes INTEGER, volatile_at REAL)"
+    )
+
+    def __init__(self, path=DEFAULT_CACHE_DB, static_ttl=30 * 86400, volatile_ttl=6 * 3600):
+        super().__init__(path)
+        self.static_ttl = static_ttl
+        self.volatile_ttl = volatile_ttl
+
+    def get(self, video_id):
+        """Return the cached fields that are still within their TTL (possibly none)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, release_date, static_at, views, likes, volatile_at"
+                " FROM metadata WHERE video_id = ?", (video_id,)
+            ).fetchone()
+        if row is None:
+            return {}
+        title, release_date, static_at, views, likes, volatile_at = row
+        now = time.time()
+        fields = {}
+        if static_at and now - static_at < self.static_ttl:
+            fields.update(title=title, release_date=release_date)
+        if volatile_at and now - volatile_at < self.volatile_ttl:
+            fields.update(views=views, likes=likes)
+        return fields
+
+    def put(self, metadata):
+        """Store a successfully fetched metadata record."""
+        if metadata["title"] == "N/A":
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (metadata["video_id"], metadata["title"], metadata["release_date"], now,
+                 metadata["views"], metadata["likes"], now),
+            )
+
+    def put_stats(self, video_id, views, likes):
+        """Refresh only the volatile fields of an already cached video."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE metadata SET views = ?, likes = ?, volatile_at = ? WHERE video_id = ?",
+                (views, likes, time.time(), video_id),
+            )
+
+
+class TranscriptStore(_SqliteStore):
+    """Permanent transcript store keyed by (video_id, source).
+
+    `source` is "captions:<language>" or "whisper:<model name>". Transcripts
+    never expire: a Whisper result is only recomputed for a different model.
+    Segment timings (see pack_segments) are kept alongside as JSON.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS transcripts ("
+        " video_id TEXT, source TEXT, text TEXT, created_at REAL, segments TEXT,"
+        " PRIMARY KEY (video_id, source))"
+    )
+
+    def __init__(self, path=DEFAULT_CACHE_DB):
+        super().__init__(path)
+        with self._lock, self._conn:
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(transcripts)")]
+            if "segments" not in columns:
+                # Databases created before segments were stored
+                self._conn.execute("ALTER TABLE transcripts ADD COLUMN segments TEXT")
+
+    def get(self, video_id, source):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text FROM transcripts WHERE video_id = ? AND source = ?",
+                (video_id, source),
+            ).fetchone()
+        return row[0] if row else None
+
+    def get_captions(self, video_id, languages=("en",)):
+        """Return the stored caption source CaptionFetcher would pick, or None.
+
+        A track in a preferred language wins, then a translation into one,
+        each in the order of `languages`. Tracks in other languages are never
+        returned: CaptionFetcher only takes them when it finds nothing better,
+        which the store can't know, so those videos are fetched again.
+        """
+        with self._lock:
+            sources = {row[0] for row in self._conn.execute(
+                "SELECT source FROM transcripts WHERE video_id = ? AND source LIKE 'captions:%'",
+                (video_id,),
+            )}
+        for language in languages:
+            if f"captions:{language}" in sources:
+                return f"captions:{language}"
+        for language in languages:
+            translated = sorted(source for source in sources if source.endswith(f"->{language}"))
+            if translated:
+                return translated[0]
+        return None
+
+    def segments(self, video_id, source):
+        """Return the segment columns stored with a transcript, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT segments FROM transcripts WHERE video_id = ? AND source = ?",
+                (video_id, source),
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def put(self, video_id, source, text, segments=None):
+        if not text or text == "N/A":
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcripts"
+                " (video_id, source, text, created_at, segments) VALUES (?, ?, ?, ?, ?)",
+                (video_id, source, text, time.time(),
+                 json.dumps(segments, separators=(",", ":")) if segments else None),
+            )
+
+
+class FingerprintIndex(_SqliteStore):
+    """Acoustic fingerprints (see audio_fingerprint) of transcribed clips.
+
+    Used to spot a short re-uploaded or cross-posted under a new video ID,
+    so its transcript can be reused instead of running Whisper again. Every
+    WORD_STRIDE-th 32-bit word of each fingerprint is indexed, so a lookup
+    only fully compares the few clips that share words with the query.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS fingerprints ("
+        " video_id TEXT PRIMARY KEY, duration REAL, fingerprint BLOB, created_at REAL)"
+    )
+    WORD_STRIDE = 4
+    # Most clips fully compared per lookup (a few ms each)
+    MAX_CANDIDATES = 50
+
+    def __init__(self, path=DEFAULT_CACHE_DB):
+        super().__init__(path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS fingerprints_duration ON fingerprints (duration)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprint_words (word INTEGER, video_id TEXT)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS fingerprint_words_word ON fingerprint_words (word)")
+            # put() replaces a clip's words by video ID
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS fingerprint_words_video"
+                " ON fingerprint_words (video_id)")
+
+    @staticmethod
+    def _words(fingerprint, stride=1):
+        import numpy as np
+        words = np.unique(np.frombuffer(fingerprint, dtype=">u4")[::stride])
+        # All-zero and all-one words come from flat or silent stretches of any clip
+        return [int(word) for word in words if word not in (0, 0xFFFFFFFF)]
+
+    def match(self, video_id, duration, fingerprint, tolerance=2.0):
+        """Return the ID of another clip that sounds the same, or None.
+
+        Only clips whose duration is within `tolerance` seconds are compared:
+        those sharing the most indexed words first, then the closest in
+        duration, up to MAX_CANDIDATES in all. A noisy or misaligned copy
+        shares few exact words, so it is only found among those closest ones.
+        """
+        window = (duration - tolerance, duration + tolerance, video_id)
+        words = self._words(fingerprint)
+        hits = {}
+        with self._lock:
+            for i in range(0, len(words), 500):
+                chunk = words[i:i + 500]
+                for (other,) in self._conn.execute(
+                        "SELECT w.video_id FROM fingerprint_words w"
+                        " JOIN fingerprints f ON f.video_id = w.video_id"
+                        f" WHERE w.word IN ({','.join('?' * len(chunk))})"
+                        " AND f.duration BETWEEN ? AND ? AND f.video_id != ?",
+                        (*chunk, *window)):
+                    hits[other] = hits.get(other, 0) + 1
+            candidates = sorted(hits, key=hits.get, reverse=True)[:self.MAX_CANDIDATES]
+            nearest = self._conn.execute(
+                "SELECT video_id FROM fingerprints"
+                " WHERE duration BETWEEN ? AND ? AND video_id != ?"
+                " ORDER BY ABS(duration - ?) LIMIT ?",
+                (*window, duration, self.MAX_CANDIDATES),
+            ).fetchall()
+            for (other,) in nearest:
+                if len(candidates) >= self.MAX_CANDIDATES:
+                    break
+                if other not in hits:
+                    candidates.append(other)
+            blobs = dict(self._conn.execute(
+                "SELECT video_id, fingerprint FROM fingerprints"
+                f" WHERE video_id IN ({','.join('?' * len(candidates))})", candidates,
+            ).fetchall()) if candidates else {}
+        for other in candidates:
+            if fingerprints_match(fingerprint, blobs[other]):
+                return other
+        return None
+
+    def put(self, video_id, duration, fingerprint):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?)",
+                (video_id, duration, fingerprint, time.time()),
+            )
+            self._conn.execute("DELETE FROM fingerprint_words WHERE video_id = ?", (video_id,))
+            self._conn.executemany(
+                "INSERT INTO fingerprint_words VALUES (?, ?)",
+                [(word, video_id) for word in self._words(fingerprint, self.WORD_STRIDE)])
+
+
+# ---------------------------------------------------------------------------
+# Checkpoint journal for --resume
+# ---------------------------------------------------------------------------
+
+class Journal:
+    """Append-only JSON-lines log of every finished metadata and transcript result.
+
+    Each line is flushed as soon as a result completes, so an interrupted run
+    loses at most the videos that were in flight. With `resume`, the existing
+    log is replayed into `metadata` / `transcripts` / `segments` and appended
+    to; otherwise it is started afresh. Failed lookups are not logged and are
+    retried on resume.
+    """
+
+    def __init__(self, path, resume=False):
+        self.path = path
+        self.metadata = {}
+        self.transcripts = {}
+        self.segments = {}
+        self._torn = False
+        if resume and os.path.exists(path):
+            self._replay()
+        self._lock = threading.Lock()
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+        if resume and self._torn:
+            # Start appending on a fresh line after a half-written entry
+            self._file.write("\n")
+
+    def _replay(self):
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                self._torn = not line.endswith("\n")
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Torn last line from a crash mid-write
+                    continue
+                if entry["kind"] == "metadata":
+                    self.metadata[entry["video_id"]] = entry["data"]
+                elif entry["kind"] == "transcript":
+                    self.transcripts[entry["video_id"]] = entry["text"]
+                    if entry.get("segments"):
+                        self.segments[entry["video_id"]] = entry["segments"]
+
+    def _write(self, entry):
+        with self._lock:
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._file.flush()
+
+    def record_metadata(self, metadata):
+        if metadata["title"] != "N/A" and "error" not in metadata:
+            self._write({"kind": "metadata", "video_id": metadata["video_id"], "data": metadata})
+
+    def record_transcript(self, video_id, text, segments=None):
+        if text and text != "N/A":
+            entry = {"kind": "transcript", "video_id": video_id, "text": text}
+            if segments:
+                entry["segments"] = segments
+            self._write(entry)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def discard(self):
+        """Close and delete the journal once its results have been exported."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
 # ---------------------------------------------------------------------------
 # Step 2: Get metadata for each video via yt-dlp
 # ---------------------------------------------------------------------------
@@ -89,21 +659,123 @@ def _ydl_base_opts(cookies_browser=None):
     return opts
 
 
-def get_video_metadata(video_id, cookies_browser=None):
-    """Use yt-dlp to extract metadata for a single video (no download)."""
+class YdlSession:
+    """Pool of yt_dlp.YoutubeDL instances reused for a whole run.
+
+    Building a YoutubeDL initializes every extractor, the HTTP opener and the
+    cookie jar (including browser cookie extraction), so instances are created
+    once per option set and lent out again for each video. A YoutubeDL is not
+    thread-safe, so each instance is used by one caller at a time and at most
+    `size` instances exist per option set.
+    """
+
+    def __init__(self, size=1):
+        self.size = max(1, size)
+        self._lock = threading.Lock()
+        self._idle = {}
+        self._instances = {}
+
+    @contextmanager
+    def borrow(self, key, opts):
+        """Lend a YoutubeDL built from `opts`; `key` identifies the option set."""
+        ydl = None
+        with self._lock:
+            idle = self._idle.setdefault(key, queue.LifoQueue())
+            instances = self._instances.setdefault(key, [])
+            if idle.empty() and len(instances) < self.size:
+                ydl = yt_dlp.YoutubeDL(opts)
+                instances.append(ydl)
+        if ydl is None:
+            ydl = idle.get()
+        try:
+            yield ydl
+        finally:
+            idle.put(ydl)
+
+    def close(self):
+        with self._lock:
+            for instances in self._instances.values():
+                for ydl in instances:
+                    # __exit__ saves cookies and closes the request handlers
+                    ydl.__exit__(None, None, None)
+            self._idle.clear()
+            self._instances.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _ydl(session, key, opts):
+    """Borrow a pooled YoutubeDL from `session`, or build a throwaway one."""
+    if session is not None:
+        return session.borrow(key, opts)
+    return yt_dlp.YoutubeDL(opts)
+
+
+def get_video_metadata(video_id, cookies_browser=None, session=None, limiter=None,
+                       cache=None, refresh=False, listed=None):
+    """Use yt-dlp to extract metadata for a single video (no download).
+
+    A MetadataCache hit with every field still fresh skips the request;
+    `refresh` ignores cached values (fresh results are still stored).
+
+    `listed` holds the fields parsed from the channel listing (see
+    parse_listing_metadata). The listing never has the upload date or likes:
+    when the cache still knows the release date, the title comes from the
+    listing and views/likes from the lighter get_video_stats lookup instead
+    of a full extraction; otherwise the full lookup runs. If that light
+    lookup fails, the row keeps the listing's approximate view count and
+    gets an "error" class rather than costing a second, full request.
+    """
     url = f"https://www.youtube.com/shorts/{video_id}"
     ydl_opts = {**_ydl_base_opts(cookies_browser), "skip_download": True}
 
+    cached = cache.get(video_id) if cache is not None and not refresh else {}
+    if len(cached) == 4:
+        return {
+            "title": cached["title"],
+            "views": cached["views"],
+            "likes": cached["likes"],
+            "release_date": cached["release_date"],
+            "video_url": url,
+            "video_id": video_id,
+        }
+    if listed and listed.get("title") and cached.get("release_date"):
+        metadata = {
+            "title": listed["title"],
+            "views": listed.get("views"),
+            "likes": None,
+            "release_date": cached["release_date"],
+            "video_url": url,
+            "video_id": video_id,
+        }
+        try:
+            metadata["views"], metadata["likes"] = _fetch_stats(video_id, cookies_browser,
+                                                                session, limiter)
+        except Exception as e:
+            print(f"    Failed to get likes for {video_id}: {e}")
+            metadata["error"] = classify_error(e)
+            return metadata
+        if cache is not None:
+            cache.put_stats(video_id, metadata["views"], metadata["likes"])
+        return metadata
+
+    def extract():
+        with _ydl(session, "metadata", ydl_opts) as ydl:
+            return ydl.extract_info(url, download=False)
+
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+        info = _with_retries(extract, limiter)
 
         upload_date = info.get("upload_date", "")
         if upload_date and len(upload_date) == 8:
             # Convert YYYYMMDD to YYYY-MM-DD
             upload_date = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
 
-        return {
+        metadata = {
             "title": info.get("title", "N/A"),
             "views": info.get("view_count"),
             "likes": info.get("like_count"),
@@ -111,6 +783,9 @@ def get_video_metadata(video_id, cookies_browser=None):
             "video_url": url,
             "video_id": video_id,
         }
+        if cache is not None:
+            cache.put(metadata)
+        return metadata
     except Exception as e:
         print(f"    Failed to get metadata for {video_id}: {e}")
         return {
@@ -120,26 +795,48 @@ def get_video_metadata(video_id, cookies_browser=None):
             "release_date": "N/A",
             "video_url": url,
             "video_id": video_id,
+            "error": classify_error(e),
         }
 
 
-def collect_metadata(video_ids, cookies_browser=None):
-    """Get metadata for all videos with progress reporting."""
+def collect_metadata(video_ids, cookies_browser=None, session=None, workers=1,
+                     limits=None, cache=None, refresh=False, listing=None, journal=None):
+    """Get metadata for all videos with progress reporting.
+
+    With workers > 1 lookups run on a bounded thread pool; results are still
+    returned in the order of `video_ids`. Request pacing comes from the shared
+    "metadata" rate limiter in `limits` (see build_rate_limits). `listing`
+    maps video IDs to fields already parsed from the channel listing. Results
+    already in `journal` are reused and new ones are appended to it.
+    """
     print(f"\n[{_ts()}] Collecting metadata for {len(video_ids)} videos...")
+    limiter = (limits or build_rate_limits())["metadata"]
+
+    def fetch(video_id):
+        if journal is not None and video_id in journal.metadata:
+            return journal.metadata[video_id], 0.0
+        t0 = time.perf_counter()
+        metadata = get_video_metadata(video_id, cookies_browser, session, limiter,
+                                      cache, refresh, (listing or {}).get(video_id))
+        if journal is not None:
+            journal.record_metadata(metadata)
+        return metadata, time.perf_counter() - t0
 
     results = []
-    for i, video_id in enumerate(video_ids, 1):
-        if i % 10 == 0 or i == 1:
-            print(f"  Processing {i}/{len(video_ids)}...")
-
-        metadata = get_video_metadata(video_id, cookies_browser)
-        results.append(metadata)
-
-        # Small delay to avoid rate limiting
-        time.sleep(0.5)
+    fetch_time = 0.0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        fetched = pool.map(fetch, video_ids) if workers > 1 else map(fetch, video_ids)
+        for i, (metadata, elapsed) in enumerate(fetched, 1):
+            if i % 10 == 0 or i == 1:
+                print(f"  Processing {i}/{len(video_ids)}...")
+            results.append(metadata)
+            fetch_time += elapsed
 
     successful = sum(1 for r in results if r["title"] != "N/A")
     print(f"  Metadata collected: {successful}/{len(video_ids)} successful")
+    _print_error_summary(results)
+    if video_ids:
+        print(f"  Average lookup time: {fetch_time / len(video_ids):.2f}s/video")
     return results
 
 
@@ -147,133 +844,1399 @@ def collect_metadata(video_ids, cookies_browser=None):
 # Step 3: Get transcripts via youtube-transcript-api + Whisper fallback
 # ---------------------------------------------------------------------------
 
-def get_transcript_captions(video_id):
-    """Fetch YouTube captions for a single video. Returns text or None."""
+class CaptionFetcher:
+    """youtube-transcript-api client that owns one pooled, keep-alive requests.Session.
+
+    The static YouTubeTranscriptApi helpers open a new session (and so new
+    connections) per video; here the connection pool is sized to the number
+    of worker threads and reused for the whole run. Cookies from
+    `cookies_browser` are loaded once and shared by every request.
+    `languages` are the caption languages to look for, most preferred first.
+    """
+
+    def __init__(self, pool_size=1, cookies_browser=None, languages=("en",)):
+        self.languages = tuple(languages)
+        self._spoken = {}
+        self._lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if cookies_browser:
+            try:
+                from yt_dlp.cookies import extract_cookies_from_browser
+                self.session.cookies.update(extract_cookies_from_browser(cookies_browser))
+            except Exception as e:
+                print(f"  Could not load {cookies_browser} cookies for captions: {e}")
+
+    def _list_transcripts(self, video_id):
+        if hasattr(YouTubeTranscriptApi, "list"):
+            # youtube-transcript-api >= 1.0 takes the session as its HTTP client
+            return YouTubeTranscriptApi(http_client=self.session).list(video_id)
+        from youtube_transcript_api._transcripts import TranscriptListFetcher
+        return TranscriptListFetcher(self.session).fetch(video_id)
+
+    def fetch(self, video_id, languages=None):
+        """Return (segments, language) for the best caption track of a video.
+
+        Tracks are tried in this order: manual captions in a preferred
+        language, auto-generated ones, a YouTube translation of any track
+        into a preferred language ("es->en"), then any track at all. The
+        library's "no transcript" error is raised only if there are none.
+        """
+        segments, language = self._find(video_id, tuple(languages or self.languages))
+        # The audio is in the track's source language, also for translations
+        spoken = language.split("->")[0].split("-")[0].lower()
+        with self._lock:
+            self._spoken[spoken] = self._spoken.get(spoken, 0) + 1
+        return segments, language
+
+    def spoken_language(self, min_share=0.8):
+        """The language of the fetched tracks, if at least `min_share` of them agree."""
+        with self._lock:
+            if not self._spoken:
+                return None
+            language, count = max(self._spoken.items(), key=lambda item: item[1])
+            return language if count >= min_share * sum(self._spoken.values()) else None
+
+    def _find(self, video_id, languages):
+        transcripts = self._list_transcripts(video_id)
+        for find in (transcripts.find_manually_created_transcript,
+                     transcripts.find_generated_transcript):
+            try:
+                transcript = find(languages)
+                return transcript.fetch(), transcript.language_code
+            except NoTranscriptFound:
+                pass
+
+        available = list(transcripts)  # manual tracks are listed first
+        for language in languages:
+            for transcript in available:
+                if transcript.is_translatable and language in _translation_codes(transcript):
+                    segments = transcript.translate(language).fetch()
+                    return segments, f"{transcript.language_code}->{language}"
+        if not available:
+            # Let the library raise its own "no transcript" error
+            transcripts.find_transcript(languages)
+        return available[0].fetch(), available[0].language_code
+
+    def close(self):
+        self.session.close()
+
+
+def _translation_codes(transcript):
+    # Plain dicts before youtube-transcript-api 1.0, TranslationLanguage objects after
+    return {lang["language_code"] if isinstance(lang, dict) else lang.language_code
+            for lang in transcript.translation_languages}
+
+
+def _segment_fields(segment):
+    # Plain dicts before youtube-transcript-api 1.0, snippet objects after
+    if isinstance(segment, dict):
+        return segment["start"], segment["duration"], segment["text"]
+    return segment.start, segment.duration, segment.text
+
+
+def pack_segments(segments, sep=" "):
+    """Join (start, duration, text) segments into one transcript string.
+
+    Returns (text, columns). The timings are kept as parallel arrays rather
+    than one dict per segment, which keeps large datasets small:
+    {"starts": [...], "durations": [...], "offsets": [...]}, where offsets[i]
+    is the index in `text` at which segment i begins (seconds are rounded to
+    milliseconds).
+    """
+    starts, durations, offsets, parts = [], [], [], []
+    position = 0
+    for start, duration, part in segments:
+        if parts:
+            position += len(sep)
+        starts.append(round(start, 3))
+        durations.append(round(duration, 3))
+        offsets.append(position)
+        parts.append(part)
+        position += len(part)
+    return sep.join(parts), {"starts": starts, "durations": durations, "offsets": offsets}
+
+
+def get_transcript_captions(video_id, limiter=None, store=None, fetcher=None, segment_map=None):
+    """Fetch YouTube captions for a single video. Returns text or None.
+
+    A caption transcript already in the TranscriptStore for the fetcher's
+    language preferences is returned without any request. Pass a shared
+    CaptionFetcher to reuse its connection pool and caption language
+    preferences; the track used is stored under "captions:<lang>" or, for a
+    translation, "captions:<source>-><lang>".
+    The caption timings (see pack_segments) go to `segment_map` if given.
+    """
+    fetcher = fetcher or CaptionFetcher()
+    if store is not None:
+        source = store.get_captions(video_id, fetcher.languages)
+        text = store.get(video_id, source) if source else None
+        if text:
+            if segment_map is not None:
+                segment_map[video_id] = store.segments(video_id, source)
+            return text
     try:
-        transcript_list = YouTubeTranscriptApi.get_transcript(video_id)
-        text = " ".join(segment["text"] for segment in transcript_list)
+        segments, language = _with_retries(lambda: fetcher.fetch(video_id), limiter)
+        text, columns = pack_segments(_segment_fields(segment) for segment in segments)
+        if store is not None:
+            store.put(video_id, f"captions:{language}", text, columns)
+        if segment_map is not None:
+            segment_map[video_id] = columns
         return text
     except Exception:
         return None
 
 
-def download_audio(video_id, temp_dir, cookies_browser=None):
-    """Download audio for a video using yt-dlp. Returns path to audio file or None."""
+def download_audio(video_id, temp_dir, cookies_browser=None, session=None, limiter=None,
+                   native=False):
+    """Download audio for a video using yt-dlp.
+
+    Returns (audio_path, None), or (None, error class) on failure (see
+    classify_error). By default the clip is transcoded to MP3; with `native` the original
+    audio stream (opus/m4a) is kept as-is, skipping the ffmpeg re-encode.
+    """
     url = f"https://www.youtube.com/shorts/{video_id}"
-    output_path = os.path.join(temp_dir, f"{video_id}.%(ext)s")
+    # Template by %(id)s, not the literal ID: pooled YoutubeDLs keep their outtmpl
+    output_path = os.path.join(temp_dir, "%(id)s.%(ext)s")
     ydl_opts = {
         **_ydl_base_opts(cookies_browser),
         "format": "bestaudio/best",
         "outtmpl": output_path,
-        "postprocessors": [{
+    }
+    if not native:
+        ydl_opts["postprocessors"] = [{
             "key": "FFmpegExtractAudio",
             "preferredcodec": "mp3",
             "preferredquality": "96",
-        }],
-    }
-    try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        }]
+
+    def download():
+        with _ydl(session, ("audio", temp_dir, native), ydl_opts) as ydl:
             ydl.download([url])
+
+    try:
+        _with_retries(download, limiter)
+        if native:
+            matches = [path for path in glob.glob(os.path.join(temp_dir, glob.escape(video_id) + ".*"))
+                       if not path.endswith((".part", ".ytdl"))]
+            if matches:
+                return matches[0], None
         audio_path = os.path.join(temp_dir, f"{video_id}.mp3")
         if os.path.exists(audio_path):
-            return audio_path
+            return audio_path, None
+        print(f"    Audio download for {video_id} produced no file")
+        return None, "unknown"
     except Exception as e:
-        print(f"    Audio download failed for {video_id}: {e}")
-    return None
+        error = classify_error(e)
+        print(f"    Audio download failed for {video_id} ({error}): {e}")
+        return None, error
+
+
+class AudioPrefetcher:
+    """Downloads audio on background threads ahead of Whisper.
+
+    Finished downloads wait in a queue of at most `max_queued` clips, and a
+    downloader does not start another clip while the clips waiting on disk
+    total `max_bytes` or more (so the cap is exceeded by at most one clip per
+    downloader). Iterating yields (video_id, audio_path or None) in completion
+    order; call done(audio_path) after transcribing to delete the file and
+    free its share of the disk budget. `errors` maps the video ID of every
+    failed download to its error class.
+    """
+
+    _FINISHED = object()
+
+    def __init__(self, video_ids, temp_dir, cookies_browser=None, session=None, limiter=None,
+                 workers=2, max_queued=4, max_bytes=256 * 1024 * 1024, native=False):
+        self.temp_dir = temp_dir
+        self.native = native
+        self.cookies_browser = cookies_browser
+        self.session = session
+        self.limiter = limiter
+        self.max_bytes = max_bytes
+        self._pending = queue.Queue()
+        for video_id in video_ids:
+            self._pending.put(video_id)
+        self._ready = queue.Queue(maxsize=max(1, max_queued))
+        self.errors = {}
+        self._sizes = {}
+        self._bytes = 0
+        self._disk = threading.Condition()
+        self._workers = max(1, workers)
+        for _ in range(self._workers):
+            threading.Thread(target=self._download_loop, daemon=True).start()
+
+    def _download_loop(self):
+        while True:
+            try:
+                video_id = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            with self._disk:
+                # Something is always let through when nothing is waiting on disk
+                while self._bytes and self._bytes >= self.max_bytes:
+                    self._disk.wait()
+            audio_path, error = download_audio(video_id, self.temp_dir, self.cookies_browser,
+                                               self.session, self.limiter, self.native)
+            if error:
+                self.errors[video_id] = error
+            if audio_path:
+                size = os.path.getsize(audio_path)
+                with self._disk:
+                    self._sizes[audio_path] = size
+                    self._bytes += size
+            self._ready.put((video_id, audio_path))
+        self._ready.put(self._FINISHED)
+
+    def __iter__(self):
+        finished = 0
+        while finished < self._workers:
+            item = self._ready.get()
+            if item is self._FINISHED:
+                finished += 1
+            else:
+                yield item
+
+    @property
+    def saturated(self):
+        """True while downloads are paused on the disk budget until done() frees some."""
+        with self._disk:
+            return bool(self._bytes) and self._bytes >= self.max_bytes
+
+    def done(self, audio_path):
+        """Delete a transcribed clip and release its disk budget."""
+        try:
+            os.remove(audio_path)
+        except OSError:
+            pass
+        with self._disk:
+            self._bytes -= self._sizes.pop(audio_path, 0)
+            self._disk.notify_all()
+
+
+def decode_audio(audio_path, sample_rate=16000):
+    """Decode an audio file to the mono float32 array at 16 kHz that Whisper takes.
+
+    Decoding happens in-process through PyAV (optional: pip install av), so
+    there is no ffmpeg subprocess. Returns None if PyAV is not installed.
+    """
+    try:
+        import av
+        import numpy as np
+    except ImportError:
+        return None
+
+    resampler = av.AudioResampler(format="s16", layout="mono", rate=sample_rate)
+    chunks = []
+    with av.open(audio_path) as container:
+        for frame in itertools.chain(container.decode(audio=0), [None]):
+            # None flushes the resampler; PyAV < 9 returns a frame, not a list
+            resampled = resampler.resample(frame)
+            for out in resampled if isinstance(resampled, list) else [resampled]:
+                if out is not None:
+                    chunks.append(out.to_ndarray().reshape(-1))
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(chunks).astype(np.float32) / 32768.0
+
+
+# Transcript marker for clips the voice-activity pass found no speech in
+NO_SPEECH = "no_speech"
+
+
+def trim_silence(audio, sample_rate=16000, frame_ms=30, padding_ms=300, min_speech_ms=250):
+    """Cut a decoded clip down to its voiced parts; None if it has no speech.
+
+    30 ms frames are classified by webrtcvad when installed (optional: pip
+    install webrtcvad), which also rejects most music; otherwise by an energy
+    threshold, which only catches silence and near-silence. Voiced frames
+    keep `padding_ms` of context on either side. Returns (audio, kept), where
+    kept[i] is the original start time in seconds of the i-th kept frame.
+    """
+    import numpy as np
+
+    frame = sample_rate * frame_ms // 1000
+    count = len(audio) // frame
+    if not count:
+        return None
+    frames = audio[:count * frame].reshape(count, frame)
+    try:
+        import webrtcvad
+        vad = webrtcvad.Vad(2)
+        pcm = (np.clip(frames, -1.0, 1.0) * 32767).astype(np.int16)
+        voiced = np.array([vad.is_speech(f.tobytes(), sample_rate) for f in pcm])
+    except ImportError:
+        rms = np.sqrt((frames ** 2).mean(axis=1))
+        # Relative to the loud end of the clip, with a -40 dBFS floor for silence
+        voiced = rms > max(0.01, 0.1 * np.percentile(rms, 95))
+
+    if voiced.sum() * frame_ms < min_speech_ms:
+        return None
+    pad = padding_ms // frame_ms
+    # Full convolution, centred back onto the frames: mode="same" would return
+    # the kernel's length for clips shorter than it
+    keep = np.convolve(voiced, np.ones(2 * pad + 1))[pad:pad + count] > 0
+    return frames[keep].reshape(-1), (np.flatnonzero(keep) * frame_ms / 1000).tolist()
+
+
+def audio_fingerprint(audio, sample_rate=16000, frame=2048, hop=512, bands=33):
+    """Compact acoustic fingerprint of a decoded clip, as bytes.
 
+    Each 32 ms step yields one 32-bit word: bit m is set when the energy
+    difference between bands m and m+1 (log-spaced, 300-2000 Hz) grew since
+    the previous step (Haitsma & Kalker). About 7.5 KB per minute of audio;
+    robust to re-encoding and volume changes. None for clips under a second.
+    """
+    import numpy as np
 
-def whisper_transcribe(audio_path, model):
-    """Transcribe an audio file using Whisper. Returns text or None."""
+    count = 1 + (len(audio) - frame) // hop
+    if len(audio) < sample_rate or count < 2:
+        return None
+    windows = audio[np.arange(frame)[None, :] + hop * np.arange(count)[:, None]]
+    spectrum = np.abs(np.fft.rfft(windows * np.hanning(frame).astype(np.float32))) ** 2
+    freqs = np.fft.rfftfreq(frame, 1 / sample_rate)
+    edges = np.geomspace(300, 2000, bands + 1)
+    energy = np.stack([spectrum[:, (freqs >= low) & (freqs < high)].sum(axis=1)
+                       for low, high in zip(edges[:-1], edges[1:])], axis=1)
+    band_diff = np.diff(energy, axis=1)
+    bits = (band_diff[1:] - band_diff[:-1]) > 0
+    return np.packbits(bits, axis=1).tobytes()
+
+
+def fingerprints_match(a, b, max_shift=32, max_ber=0.3):
+    """True if two audio_fingerprint values are near-identical.
+
+    The fingerprints are aligned at up to `max_shift` steps (about 1 s) of
+    offset, to allow for trimmed intros, and match when under `max_ber` of
+    the overlapping bits differ; unrelated audio differs in about half.
+    """
+    import numpy as np
+
+    a = np.frombuffer(a, dtype=np.uint8).reshape(-1, 4)
+    b = np.frombuffer(b, dtype=np.uint8).reshape(-1, 4)
+    for shift in range(-max_shift, max_shift + 1):
+        x, y = (a[shift:], b) if shift >= 0 else (a, b[-shift:])
+        overlap = min(len(x), len(y))
+        if overlap < 0.8 * min(len(a), len(b)):
+            continue
+        errors = np.unpackbits(x[:overlap] ^ y[:overlap]).mean()
+        if errors < max_ber:
+            return True
+    return False
+
+
+# Set once _prepare_audio has warned that --vad is skipped without PyAV
+_vad_warned = False
+
+
+def _prepare_audio(audio_path, vad=False, audio=None):
+    """Audio to hand a backend, and the trim_silence frame times if trimmed.
+
+    The audio is decoded when PyAV is available (unless `audio` already holds
+    the decoded clip), else it is the path. With `vad`, silence is trimmed
+    first and (None, None) means no speech was found. VAD needs the decoded
+    samples, so it is skipped without PyAV.
+    """
+    global _vad_warned
+    if audio is None:
+        audio = decode_audio(audio_path)
+    if audio is None:
+        if vad and not _vad_warned:
+            _vad_warned = True
+            print("    --vad needs PyAV to decode clips; transcribing them untrimmed:")
+            print("      pip install av")
+        return audio_path, None
+    if not vad:
+        return audio, None
+    return trim_silence(audio) or (None, None)
+
+
+def _untrim(columns, kept, frame_ms=30):
+    """Map segment starts in silence-trimmed audio back onto the original clip."""
+    if not columns or not kept:
+        return columns
+    frame = frame_ms / 1000
+    starts = []
+    for start in columns["starts"]:
+        i = min(int(start / frame), len(kept) - 1)
+        starts.append(round(kept[i] + start - i * frame, 3))
+    return dict(columns, starts=starts)
+
+
+class OpenAIWhisperBackend:
+    """openai-whisper (PyTorch) speech recognition."""
+
+    name = "openai-whisper"
+    module = "whisper"
+
+    def __init__(self, model_name, threads=None):
+        import whisper
+        if threads:
+            import torch
+            torch.set_num_threads(threads)
+        self.whisper = whisper
+        self.model = whisper.load_model(model_name)
+
+    def transcribe(self, audio, language=None):
+        """Transcribe a path or 16 kHz float32 array.
+
+        Returns (text, segments, language) with text and segments as from
+        pack_segments. A `language` hint skips language detection; if it is
+        unsupported or the result scores poorly, the clip is redone with
+        detection.
+        """
+        result = None
+        if language:
+            try:
+                result = self.model.transcribe(audio, language=language)
+            except ValueError:
+                pass
+            if result and _low_confidence([s["avg_logprob"] for s in result["segments"]]):
+                result = None
+        if result is None:
+            result = self.model.transcribe(audio)
+        segments = result.get("segments", [])
+        # Whisper's own text is the segments run together, led by a space
+        text, columns = pack_segments(((segment["start"], segment["end"] - segment["start"],
+                                        segment["text"].lstrip() if i == 0 else segment["text"])
+                                       for i, segment in enumerate(segments)), sep="")
+        return text, columns, result.get("language")
+
+    def transcribe_batch(self, audios, language=None):
+        """Transcribe several clips in one batched encoder/decoder pass.
+
+        Each clip is cut into 30 s mel windows and the windows of all clips
+        are decoded together, then joined back per clip. Unlike transcribe()
+        there is no temperature fallback or timestamp seeking, which shorts
+        rarely need, and each window is one segment. The `language` hint is
+        checked per window as in transcribe(). Returns one (text, segments,
+        language) per clip.
+        """
+        import torch
+
+        mels, owners = [], []
+        window = self.whisper.audio.N_SAMPLES
+        rate = self.whisper.audio.SAMPLE_RATE
+        for i, audio in enumerate(audios):
+            if isinstance(audio, str):
+                audio = self.whisper.load_audio(audio)
+            for start in range(0, max(len(audio), 1), window):
+                chunk = self.whisper.pad_or_trim(audio[start:start + window])
+                mels.append(self.whisper.log_mel_spectrogram(chunk, self.model.dims.n_mels))
+                owners.append((i, start / rate, min(window, len(audio) - start) / rate))
+
+        mels = torch.stack(mels).to(self.model.device)
+        # Segments come from the 30 s windows, so skip decoding timestamp tokens
+        fp16 = self.model.device.type == "cuda"
+        options = {"fp16": fp16, "without_timestamps": True}
+        results = None
+        if language:
+            try:
+                results = self.whisper.decode(
+                    self.model, mels, self.whisper.DecodingOptions(language=language, **options))
+            except ValueError:
+                pass
+        if results is None:
+            results = self.whisper.decode(self.model, mels, self.whisper.DecodingOptions(**options))
+        elif language:
+            redo = [j for j, result in enumerate(results) if _low_confidence([result.avg_logprob])]
+            if redo:
+                redone = self.whisper.decode(self.model, mels[redo],
+                                             self.whisper.DecodingOptions(**options))
+                for j, result in zip(redo, redone):
+                    results[j] = result
+
+        segments = [[] for _ in audios]
+        languages = [None] * len(audios)
+        for (i, start, duration), result in zip(owners, results):
+            # Same silence test transcribe() applies to each window
+            if result.no_speech_prob > 0.6 and result.avg_logprob < -1.0:
+                continue
+            segments[i].append((start, duration, result.text.strip()))
+            languages[i] = languages[i] or result.language
+        return [(*pack_segments(clip), clip_language)
+                for clip, clip_language in zip(segments, languages)]
+
+
+class FasterWhisperBackend:
+    """faster-whisper: CTranslate2 engine with int8-quantized weights, for CPU hosts."""
+
+    name = "faster-whisper"
+    module = "faster_whisper"
+
+    def __init__(self, model_name, threads=None, compute_type="int8"):
+        from faster_whisper import WhisperModel
+        self.model = WhisperModel(model_name, device="cpu", compute_type=compute_type,
+                                  cpu_threads=threads or 0)
+
+    def transcribe(self, audio, language=None):
+        """Transcribe a path or 16 kHz float32 array; returns as OpenAIWhisperBackend does."""
+        segments = None
+        if language:
+            try:
+                segments, info = self.model.transcribe(audio, language=language)
+                segments = list(segments)
+            except ValueError:
+                segments = None
+            if segments and _low_confidence([segment.avg_logprob for segment in segments]):
+                segments = None
+        if segments is None:
+            segments, info = self.model.transcribe(audio)
+        text, columns = pack_segments((segment.start, segment.end - segment.start,
+                                       segment.text.strip()) for segment in segments)
+        return text, columns, info.language
+
+
+# --asr-backend name -> backend class; each name is also its pip package name
+ASR_BACKENDS = {
+    OpenAIWhisperBackend.name: OpenAIWhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+# Below this mean token log-probability a clip transcribed with a fixed
+# language hint is redone with language detection (Whisper's logprob_threshold)
+LANGUAGE_MIN_LOGPROB = -1.0
+
+# Whisper clips that must agree before their language is reused for the rest
+LANGUAGE_DETECT_CLIPS = 3
+
+
+def _low_confidence(logprobs):
+    return bool(logprobs) and sum(logprobs) / len(logprobs) < LANGUAGE_MIN_LOGPROB
+
+
+def load_asr_backend(backend, model_name, threads=None):
+    """Instantiate an ASR backend, or return None if its package is missing."""
     try:
-        result = model.transcribe(audio_path)
-        return result.get("text", "").strip() or None
+        return ASR_BACKENDS[backend](model_name, threads)
+    except ImportError:
+        return None
+
+
+def asr_installed(backend):
+    """True if the backend's package can be imported (without importing it)."""
+    return importlib.util.find_spec(ASR_BACKENDS[backend].module) is not None
+
+
+# Model and --vad setting of an --asr-workers process, set by _asr_worker_init
+_worker_model = None
+_worker_vad = False
+
+
+def _asr_worker_init(backend, model_name, threads, vad=False):
+    global _worker_model, _worker_vad
+    _worker_model = load_asr_backend(backend, model_name, threads)
+    _worker_vad = vad
+
+
+def _asr_worker_transcribe(audio_paths, language=None, audios=None):
+    return whisper_transcribe_batch(audio_paths, _worker_model, _worker_vad, language, audios)
+
+
+def _asr_source(backend, model_name):
+    """TranscriptStore source key for a backend/model pair."""
+    if backend == OpenAIWhisperBackend.name:
+        return f"whisper:{model_name}"
+    return f"{backend}:{model_name}"
+
+
+def whisper_transcribe(audio_path, model, vad=False, language=None, audio=None):
+    """Transcribe an audio file with an ASR backend (see ASR_BACKENDS).
+
+    Returns (text, segments, language) with segments as in pack_segments and
+    the spoken language Whisper settled on. The text is None on failure, or
+    NO_SPEECH when `vad` finds no speech. `language` is a hint that skips
+    detection unless the clip scores poorly with it. `audio` is the clip
+    already decoded by decode_audio, if the caller has it.
+    """
+    try:
+        audio, kept = _prepare_audio(audio_path, vad, audio)
+        if audio is None:
+            return NO_SPEECH, None, None
+        text, segments, spoken = model.transcribe(audio, language)
+        return text.rstrip() or None, _untrim(segments, kept), spoken
     except Exception as e:
         print(f"    Whisper transcription failed: {e}")
+        return None, None, None
+
+
+def whisper_transcribe_batch(audio_paths, model, vad=False, language=None, audios=None):
+    """Transcribe several audio files, batched when the backend supports it.
+
+    Returns one result per path, as whisper_transcribe does. Backends without
+    transcribe_batch, and batches that fail as a whole, are transcribed one
+    clip at a time. `audios` holds the clips already decoded (or None each).
+    """
+    audios = audios or [None] * len(audio_paths)
+    if len(audio_paths) > 1 and hasattr(model, "transcribe_batch"):
+        try:
+            prepared = [_prepare_audio(path, vad, audio)
+                        for path, audio in zip(audio_paths, audios)]
+            speech = [audio for audio, _ in prepared if audio is not None]
+            results = iter(model.transcribe_batch(speech, language) if speech else [])
+            transcribed = []
+            for audio, kept in prepared:
+                if audio is None:
+                    transcribed.append((NO_SPEECH, None, None))
+                else:
+                    text, segments, spoken = next(results)
+                    transcribed.append((text.rstrip() or None, _untrim(segments, kept), spoken))
+            return transcribed
+        except Exception as e:
+            print(f"    Batched transcription failed, retrying clip by clip: {e}")
+    return [whisper_transcribe(path, model, vad, language, audio)
+            for path, audio in zip(audio_paths, audios)]
+
+
+def _has_transcript(text):
+    """True for real transcript text, False for the "N/A" and NO_SPEECH markers."""
+    return bool(text) and text not in ("N/A", NO_SPEECH)
+
+
+# ---------------------------------------------------------------------------
+# Warm Whisper service: keeps models loaded across collector runs
+# ---------------------------------------------------------------------------
+
+DEFAULT_WHISPER_SERVER = "http://127.0.0.1:8765"
+# Seconds to wait for the service to transcribe one clip before loading the model locally
+WHISPER_SERVICE_TIMEOUT = 300
+
+
+def _is_loopback(host):
+    """True if every address `host` resolves to is a loopback address."""
+    try:
+        return all(ipaddress.ip_address(info[4][0]).is_loopback
+                   for info in socket.getaddrinfo(host, None))
+    except (OSError, ValueError):
+        return False
+
+
+def serve_whisper(server_url=DEFAULT_WHISPER_SERVER, preload=()):
+    """Run a localhost HTTP service that keeps Whisper models resident.
+
+    POST /transcribe with {"audio_path", "model", "backend", "vad", "language"}
+    returns {"text", "segments", "language"}; GET /health lists the loaded
+    models. Audio is read from the given path, so the service must run on the
+    same machine (and user) as the collector and only binds to loopback
+    addresses. Models load on first use and stay in memory; each model
+    transcribes one clip at a time. `preload` holds (backend, model) pairs.
+    """
+    address = urlparse(server_url)
+    if not _is_loopback(address.hostname):
+        # Jobs name a file to read, so the service must not be reachable from other machines
+        print(f"Refusing to serve on {address.hostname}: the Whisper service only listens "
+              f"on loopback addresses (e.g. 127.0.0.1)")
+        sys.exit(1)
+    models = {}
+    load_lock = threading.Lock()
+
+    def get_model(backend, name):
+        with load_lock:
+            if (backend, name) not in models:
+                print(f"[{_ts()}] Loading {backend} model '{name}'...")
+                model = load_asr_backend(backend, name)
+                if model is None:
+                    raise ImportError(f"{backend} is not installed (pip install {backend})")
+                models[(backend, name)] = (model, threading.Lock())
+            return models[(backend, name)]
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, status, payload):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/health":
+                self._reply(200, {"ok": True, "models": [f"{b}:{m}" for b, m in sorted(models)]})
+            else:
+                self._reply(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path != "/transcribe":
+                self._reply(404, {"error": "not found"})
+                return
+            try:
+                job = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                model, model_lock = get_model(job.get("backend", OpenAIWhisperBackend.name),
+                                              job["model"])
+            except Exception as e:
+                self._reply(400, {"error": str(e)})
+                return
+            with model_lock:
+                text, segments, language = whisper_transcribe(
+                    job["audio_path"], model, job.get("vad", False), job.get("language"))
+            self._reply(200, {"text": text, "segments": segments, "language": language})
+
+        def log_message(self, format, *args):
+            pass
+
+    for backend, name in preload:
+        try:
+            get_model(backend, name)
+        except ImportError as e:
+            print(f"Cannot start the transcription service: {e}")
+            sys.exit(1)
+
+    server = ThreadingHTTPServer((address.hostname, address.port), Handler)
+    print(f"[{_ts()}] Whisper service listening on {server_url} (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+class WhisperClient:
+    """Sends transcription jobs to a running serve_whisper service."""
+
+    def __init__(self, server_url, model_name, backend=OpenAIWhisperBackend.name, vad=False):
+        self.server_url = server_url.rstrip("/")
+        self.model_name = model_name
+        self.backend = backend
+        self.vad = vad
+
+    def available(self):
+        try:
+            with urllib.request.urlopen(f"{self.server_url}/health", timeout=1) as resp:
+                return json.load(resp).get("ok", False)
+        except (OSError, ValueError):
+            return False
+
+    def transcribe(self, audio_path, language=None):
+        """Transcribe a local audio file remotely; returns what whisper_transcribe does.
+
+        A job the service rejects counts as a failed clip; a service that
+        stops answering (refused, reset or over WHISPER_SERVICE_TIMEOUT)
+        raises OSError.
+        """
+        job = json.dumps({"audio_path": os.path.abspath(audio_path),
+                          "model": self.model_name,
+                          "backend": self.backend,
+                          "vad": self.vad,
+                          "language": language}).encode("utf-8")
+        request = urllib.request.Request(f"{self.server_url}/transcribe", data=job,
+                                         headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=WHISPER_SERVICE_TIMEOUT) as resp:
+                reply = json.load(resp)
+            return reply.get("text"), reply.get("segments"), reply.get("language")
+        except (urllib.error.HTTPError, ValueError) as e:
+            print(f"    Whisper service transcription failed: {e}")
+            return None, None, None
+
+
+def load_transcriber(whisper_model_name="base", server_url=DEFAULT_WHISPER_SERVER,
+                     asr_backend=OpenAIWhisperBackend.name, asr_workers=1, vad=False):
+    """Return (executor, transcribe), or None if the backend is unavailable.
+
+    Jobs are run as executor.submit(transcribe, audio_paths, language, audios)
+    and return what whisper_transcribe_batch does; `audios` are the clips
+    already decoded, if any (the service reads the files itself). A running
+    Whisper service (model already warm) is preferred; if it stops answering
+    mid-run the model is loaded in-process for the remaining clips.
+    Otherwise, with asr_workers > 1 the model is loaded in that many worker
+    processes, each pinned to an equal share of the CPU cores; else it is
+    loaded once in-process. `vad` runs trim_silence on each clip first.
+    """
+    if server_url:
+        client = WhisperClient(server_url, whisper_model_name, asr_backend, vad)
+        if client.available():
+            print(f"    Using Whisper service at {server_url}")
+            local = []
+
+            def transcribe(audio_paths, language=None, audios=None):
+                if not local:
+                    try:
+                        return [client.transcribe(audio_path, language)
+                                for audio_path in audio_paths]
+                    except OSError as e:
+                        print(f"    Whisper service stopped answering ({e}); loading "
+                              f"{asr_backend} model '{whisper_model_name}' in-process...")
+                        local.append(load_asr_backend(asr_backend, whisper_model_name))
+                if local[0] is None:
+                    return [(None, None, None)] * len(audio_paths)
+                return whisper_transcribe_batch(audio_paths, local[0], vad, language, audios)
+
+            return ThreadPoolExecutor(max_workers=1), transcribe
+    if asr_workers > 1:
+        if not asr_installed(asr_backend):
+            return None
+        threads = max(1, (os.cpu_count() or 1) // asr_workers)
+        print(f"    Starting {asr_workers} {asr_backend} workers with model "
+              f"'{whisper_model_name}' ({threads} threads each)...")
+        # Spawn, not fork: the parent already runs download threads holding locks
+        executor = ProcessPoolExecutor(max_workers=asr_workers,
+                                       mp_context=multiprocessing.get_context("spawn"),
+                                       initializer=_asr_worker_init,
+                                       initargs=(asr_backend, whisper_model_name, threads, vad))
+        return executor, _asr_worker_transcribe
+    print(f"    Loading {asr_backend} model '{whisper_model_name}'...")
+    model = load_asr_backend(asr_backend, whisper_model_name)
+    if model is None:
         return None
+    return ThreadPoolExecutor(max_workers=1), lambda audio_paths, language=None, audios=None: (
+        whisper_transcribe_batch(audio_paths, model, vad, language, audios))
 
 
 def collect_transcripts(video_ids, whisper_model_name="base", use_whisper=True,
-                        cookies_browser=None):
-    """Get transcripts: try captions first, then Whisper fallback for failures."""
+                        cookies_browser=None, session=None, limits=None, journal=None,
+                        workers=1, store=None, fetcher=None, segment_map=None,
+                        **whisper_opts):
+    """Get transcripts: try captions first, then Whisper fallback for failures.
+
+    With workers > 1 caption fetches run on a bounded thread pool, paced by
+    the shared "captions" rate limiter in `limits`; `missing` keeps the order
+    of `video_ids` either way. `whisper_opts` are passed on to whisper_fallback.
+    Segment timings of every transcript are put in `segment_map` if given.
+    """
     print(f"\n[{_ts()}] Collecting transcripts for {len(video_ids)} videos...")
+    limits = limits or build_rate_limits()
+    fetcher = fetcher or CaptionFetcher(max(1, workers), cookies_browser)
     print("  Phase 1: Fetching YouTube captions...")
 
     transcript_map = {}
+    segment_map = {} if segment_map is None else segment_map
     missing = []
 
-    for i, video_id in enumerate(video_ids, 1):
-        if i % 10 == 0 or i == 1:
-            print(f"    Processing {i}/{len(video_ids)}...")
-
-        text = get_transcript_captions(video_id)
-        if text:
-            transcript_map[video_id] = text
-        else:
-            missing.append(video_id)
+    def fetch(video_id):
+        if journal is not None and video_id in journal.transcripts:
+            segment_map[video_id] = journal.segments.get(video_id)
+            return journal.transcripts[video_id]
+        text = get_transcript_captions(video_id, limits["captions"], store, fetcher,
+                                       segment_map)
+        if journal is not None:
+            journal.record_transcript(video_id, text, segment_map.get(video_id))
+        return text
 
-        time.sleep(0.3)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        fetched = pool.map(fetch, video_ids) if workers > 1 else map(fetch, video_ids)
+        for i, (video_id, text) in enumerate(zip(video_ids, fetched), 1):
+            if i % 10 == 0 or i == 1:
+                print(f"    Processing {i}/{len(video_ids)}...")
+            if text:
+                transcript_map[video_id] = text
+            else:
+                missing.append(video_id)
 
     caption_count = len(transcript_map)
     print(f"  Captions found: {caption_count}/{len(video_ids)}")
 
-    # Whisper fallback for videos without captions
+    whisper_fallback(missing, transcript_map, whisper_model_name, use_whisper,
+                     cookies_browser, session, limits, journal, store,
+                     segment_map=segment_map, language=fetcher.spoken_language(),
+                     **whisper_opts)
+
+    total = sum(1 for v in transcript_map.values() if _has_transcript(v))
+    print(f"  Total with transcripts: {total}/{len(video_ids)}")
+    return transcript_map
+
+
+class WhisperScheduler:
+    """Phase 2 job scheduling for the clips an AudioPrefetcher yields.
+
+    Clips are sent `batch_size` per job, with one job queued per ASR worker;
+    jobs holding the prefetcher's disk budget are drained first so downloads
+    never stall. Once the first clips agree on the spoken language it is
+    passed as a hint for the rest. With `fingerprints`, a clip that sounds
+    like one transcribed before reuses that transcript. Each finished clip
+    goes to `results`, `segment_map`, the journal and the store.
+
+    If an ASR worker process dies (out of memory, say) the pool is broken:
+    `fallback()` is called once for an in-process (executor, transcribe)
+    and the lost jobs are resubmitted to it. Without one, or if a job fails
+    otherwise, its clips are logged and left untranscribed.
+    """
+
+    def __init__(self, executor, transcribe, prefetcher, source, store=None, journal=None,
+                 segment_map=None, fingerprints=None, language=None, asr_workers=1,
+                 batch_size=1, fallback=None):
+        self.executor = executor
+        self.transcribe = transcribe
+        self.fallback = fallback
+        self._recovered = False
+        self.prefetcher = prefetcher
+        self.source = source
+        self.store = store
+        self.journal = journal
+        self.segment_map = segment_map
+        self.fingerprints = fingerprints
+        self.language = language
+        self.asr_workers = asr_workers
+        self.batch_size = batch_size
+        self.results = {}
+        self.reused = []
+        self._detected = {}
+        self._inflight = {}
+        self._batch = []
+
+    def run(self, total):
+        """Transcribe every clip the prefetcher yields; returns `results`."""
+        for i, (video_id, audio_path) in enumerate(self.prefetcher, 1):
+            if i % 5 == 0 or i == 1:
+                print(f"    Transcribing {i}/{total}...")
+            if audio_path:
+                self.add(video_id, audio_path)
+            # Keep one job queued per ASR worker so none of them idles, but
+            # drain jobs whose clips hold the disk budget downloads wait on
+            while self._inflight and (len(self._inflight) > max(1, self.asr_workers)
+                                      or self.prefetcher.saturated):
+                self.finish(wait(self._inflight, return_when=FIRST_COMPLETED).done)
+        if self._batch:
+            self.submit()
+        # Jobs lost with a broken worker pool are resubmitted while draining
+        while self._inflight:
+            self.finish(list(self._inflight))
+        if self._recovered:
+            self.executor.shutdown()
+        return self.results
+
+    def add(self, video_id, audio_path):
+        """Queue a downloaded clip, unless it is a re-upload of a transcribed one."""
+        audio = None
+        if self.fingerprints is not None:
+            reused, audio = self.reuse_duplicate(video_id, audio_path)
+            if reused:
+                return
+        self._batch.append((video_id, audio_path, audio))
+        # A held-back batch would stall the downloads once the disk cap is hit
+        if len(self._batch) >= self.batch_size or self.prefetcher.saturated:
+            self.submit()
+
+    def submit(self):
+        self._submit(list(self._batch))
+        self._batch.clear()
+
+    def _submit(self, jobs):
+        """Send one job of (video_id, audio_path, audio) clips to the executor."""
+        paths = [path for _, path, _ in jobs]
+        audios = [audio for _, _, audio in jobs]
+        try:
+            future = self.executor.submit(self.transcribe, paths, self.language, audios)
+        except BrokenProcessPool:
+            if not self._recover():
+                self._fail(jobs)
+                return
+            future = self.executor.submit(self.transcribe, paths, self.language, audios)
+        self._inflight[future] = jobs
+
+    def finish(self, futures):
+        """Record the results of finished jobs and delete their audio."""
+        for future in futures:
+            jobs = self._inflight.pop(future)
+            try:
+                results = future.result()
+            except BrokenProcessPool:
+                if self._recover():
+                    self._submit(jobs)
+                else:
+                    self._fail(jobs)
+                continue
+            except Exception as e:
+                print(f"    Transcription job of {len(jobs)} clips failed: {e}")
+                self._fail(jobs)
+                continue
+            for (video_id, audio_path, _), (text, segments, spoken) in zip(jobs, results):
+                if spoken and _has_transcript(text):
+                    self.observe_language(spoken)
+                self._record(video_id, text, segments)
+                # Clean up audio file immediately to save disk space
+                self.prefetcher.done(audio_path)
+
+    def _recover(self):
+        """Replace a broken worker pool with `fallback`; False if there is none."""
+        if self._recovered:
+            return True
+        if self.fallback is None:
+            return False
+        fallback, self.fallback = self.fallback, None
+        print("    An ASR worker process died (out of memory?); "
+              "transcribing the remaining clips in-process...")
+        transcriber = fallback()
+        if transcriber is None:
+            return False
+        self.executor, self.transcribe = transcriber
+        self._recovered = True
+        return True
+
+    def _fail(self, jobs):
+        """Leave a failed job's clips untranscribed and delete their audio."""
+        for video_id, audio_path, _ in jobs:
+            print(f"    Could not transcribe {video_id}")
+            self.prefetcher.done(audio_path)
+
+    def observe_language(self, spoken):
+        """Adopt the language the first clips agree on; drop it if clips disagree."""
+        self._detected[spoken] = self._detected.get(spoken, 0) + 1
+        total = sum(self._detected.values())
+        top = max(self._detected, key=self._detected.get)
+        if self.language is None:
+            if self._detected[top] >= LANGUAGE_DETECT_CLIPS and self._detected[top] >= 0.8 * total:
+                self.language = top
+                print(f"    Channel language detected: {self.language} (after {total} clips)")
+        elif total >= LANGUAGE_DETECT_CLIPS and self._detected.get(self.language, 0) < 0.5 * total:
+            # Most clips needed the detection fallback: stop paying for both passes
+            print(f"    Clips do not match channel language {self.language}; "
+                  f"detecting per clip again")
+            self.language = None
+
+    def reuse_duplicate(self, video_id, audio_path):
+        """Fingerprint a clip and reuse a known duplicate's transcript.
+
+        Returns (reused, decoded clip), so the clip is decoded only once.
+        """
+        try:
+            audio = decode_audio(audio_path)
+            fingerprint = audio_fingerprint(audio) if audio is not None else None
+            if fingerprint is None:
+                return False, audio
+            duration = len(audio) / 16000
+            original = self.fingerprints.match(video_id, duration, fingerprint)
+            self.fingerprints.put(video_id, duration, fingerprint)
+        except Exception as e:
+            # Transcription decodes (and reports) the clip itself
+            print(f"    Could not fingerprint {video_id}: {e}")
+            return False, None
+        text = self.store.get(original, self.source) if original is not None else None
+        if not text:
+            return False, audio
+        self._record(video_id, text, self.store.segments(original, self.source))
+        self.reused.append(video_id)
+        self.prefetcher.done(audio_path)
+        return True, None
+
+    def _record(self, video_id, text, segments):
+        self.results[video_id] = text
+        if self.segment_map is not None and text:
+            self.segment_map[video_id] = segments
+        if self.journal is not None:
+            self.journal.record_transcript(video_id, text, segments)
+        if self.store is not None:
+            self.store.put(video_id, self.source, text, segments)
+
+
+def whisper_fallback(missing, transcript_map, whisper_model_name="base", use_whisper=True,
+                     cookies_browser=None, session=None, limits=None, journal=None,
+                     store=None, whisper_server=DEFAULT_WHISPER_SERVER,
+                     download_workers=2, prefetch=4, prefetch_mb=256, native_audio=False,
+                     asr_backend=OpenAIWhisperBackend.name, asr_workers=1, asr_batch_size=1,
+                     vad=False, segment_map=None, language=None, fingerprints=None,
+                     transcript_errors=None):
+    """Phase 2: fill `transcript_map` for captionless videos via Whisper (or "N/A").
+
+    Videos already transcribed with the same model in `store` are filled
+    from it without loading the model. The rest are downloaded by an
+    AudioPrefetcher (`download_workers`, `prefetch`, `prefetch_mb`,
+    `native_audio`) and transcribed by load_transcriber's pick of backend,
+    in the order WhisperScheduler hands them out. `language` is the
+    channel's spoken language if captions already showed it. With `vad`,
+    clips without speech get the NO_SPEECH marker instead of "N/A". The
+    error class of each failed audio download goes to `transcript_errors`.
+    """
+    limits = limits or build_rate_limits()
+    source = _asr_source(asr_backend, whisper_model_name)
+    if missing and use_whisper and store is not None:
+        stored = 0
+        pending = []
+        for video_id in missing:
+            text = store.get(video_id, source)
+            if text:
+                transcript_map[video_id] = text
+                if segment_map is not None:
+                    segment_map[video_id] = store.segments(video_id, source)
+                stored += 1
+            else:
+                pending.append(video_id)
+        if stored:
+            print(f"\n  Reusing {stored} stored Whisper ({whisper_model_name}) transcripts")
+        missing = pending
     if missing and use_whisper:
-        if not WHISPER_AVAILABLE:
-            print(f"\n  {len(missing)} videos have no captions.")
+        print(f"\n  Phase 2: Whisper fallback for {len(missing)} videos without captions...")
+        transcriber = load_transcriber(whisper_model_name, whisper_server, asr_backend,
+                                       asr_workers, vad)
+        if transcriber is None:
             print("  Whisper not installed — install for local transcription fallback:")
-            print("    pip install openai-whisper")
+            print(f"    pip install {asr_backend}")
             for vid in missing:
                 transcript_map[vid] = "N/A"
         else:
-            print(f"\n  Phase 2: Whisper fallback for {len(missing)} videos without captions...")
-            print(f"    Loading Whisper model '{whisper_model_name}'...")
-            model = openai_whisper.load_model(whisper_model_name)
-
-            with tempfile.TemporaryDirectory() as temp_dir:
-                for i, video_id in enumerate(missing, 1):
-                    if i % 5 == 0 or i == 1:
-                        print(f"    Transcribing {i}/{len(missing)}...")
-
-                    audio_path = download_audio(video_id, temp_dir, cookies_browser)
-                    if audio_path:
-                        text = whisper_transcribe(audio_path, model)
-                        transcript_map[video_id] = text if text else "N/A"
-                        # Clean up audio file immediately to save disk space
-                        try:
-                            os.remove(audio_path)
-                        except OSError:
-                            pass
-                    else:
-                        transcript_map[video_id] = "N/A"
-
-            whisper_count = sum(1 for vid in missing if transcript_map.get(vid, "N/A") != "N/A")
-            print(f"  Whisper transcribed: {whisper_count}/{len(missing)}")
+            executor, transcribe = transcriber
+            started = time.time()
+            if language:
+                print(f"    Channel language from captions: {language}")
+            with executor, tempfile.TemporaryDirectory() as temp_dir:
+                prefetcher = AudioPrefetcher(missing, temp_dir, cookies_browser, session,
+                                             limits["audio"], workers=download_workers,
+                                             max_queued=prefetch,
+                                             max_bytes=prefetch_mb * 1024 * 1024,
+                                             native=native_audio)
+                # Should a worker process die, finish the clips in this one
+                fallback = None
+                if isinstance(executor, ProcessPoolExecutor):
+                    fallback = functools.partial(load_transcriber, whisper_model_name, None,
+                                                 asr_backend, 1, vad)
+                scheduler = WhisperScheduler(executor, transcribe, prefetcher, source, store,
+                                             journal, segment_map, fingerprints, language,
+                                             asr_workers, asr_batch_size, fallback)
+                results = scheduler.run(len(missing))
+            if transcript_errors is not None:
+                transcript_errors.update(prefetcher.errors)
+
+            for video_id in missing:
+                transcript_map[video_id] = results.get(video_id) or "N/A"
+
+            whisper_count = sum(1 for vid in missing if _has_transcript(transcript_map[vid]))
+            per_minute = len(missing) * 60 / max(time.time() - started, 1e-6)
+            print(f"  Whisper transcribed: {whisper_count}/{len(missing)} "
+                  f"({per_minute:.1f} shorts/min)")
+            if scheduler.reused:
+                print(f"  Reused transcripts of {len(scheduler.reused)} re-uploaded clips")
+            silent = sum(1 for vid in missing if transcript_map[vid] == NO_SPEECH)
+            if silent:
+                print(f"  No speech detected: {silent}")
     else:
         for vid in missing:
             transcript_map[vid] = "N/A"
+    return transcript_map
+
+
+# ---------------------------------------------------------------------------
+# Pipeline mode: overlap listing, metadata and captions
+# ---------------------------------------------------------------------------
+
+def run_pipeline(channel_url, whisper_model_name="base", use_whisper=True,
+                 cookies_browser=None, session=None, limits=None, workers=1,
+                 queue_size=100, cache=None, refresh=False, stop_at=None,
+                 fast_metadata=False, journal=None, store=None, fetcher=None,
+                 segment_map=None, **whisper_opts):
+    """Stream IDs from scrapetube straight into metadata and caption workers.
+
+    The listing thread feeds two bounded queues, so metadata and caption
+    fetches for the first shorts start while later pages are still being
+    enumerated, and at most `queue_size` IDs wait in each queue. Whisper
+    fallback runs once the caption stage has drained, with `whisper_opts`.
+    Segment timings of every transcript are put in `segment_map` if given.
+
+    Returns (video_ids, metadata_list, transcript_map) in channel order.
+    """
+    print(f"[{_ts()}] Pipeline: listing shorts and fetching data concurrently...")
+    limits = limits or build_rate_limits()
+    workers = max(1, workers)
+    fetcher = fetcher or CaptionFetcher(workers, cookies_browser)
+    start = time.time()
+
+    metadata_q = queue.Queue(maxsize=queue_size)
+    caption_q = queue.Queue(maxsize=queue_size)
+    video_ids = []
+    metadata = {}
+    transcript_map = {}
+    segment_map = {} if segment_map is None else segment_map
+    missing = []
+    listing = {} if fast_metadata else None
+    stages_done = {}
+    first_record = []
+    lock = threading.Lock()
+
+    def record_done(video_id):
+        # Called with `lock` held once a stage finishes for video_id
+        stages_done[video_id] = stages_done.get(video_id, 0) + 1
+        if stages_done[video_id] == 2 and not first_record:
+            first_record.append(video_id)
+            print(f"  First record ready after {time.time() - start:.1f}s")
+
+    def metadata_worker():
+        while True:
+            video_id = metadata_q.get()
+            if video_id is None:
+                return
+            if journal is not None and video_id in journal.metadata:
+                result = journal.metadata[video_id]
+            else:
+                listed = listing.get(video_id) if listing is not None else None
+                result = get_video_metadata(video_id, cookies_browser, session,
+                                            limits["metadata"], cache, refresh, listed)
+                if journal is not None:
+                    journal.record_metadata(result)
+            with lock:
+                metadata[video_id] = result
+                record_done(video_id)
+                if len(metadata) % 10 == 0:
+                    print(f"  Metadata: {len(metadata)} done...")
+
+    def caption_worker():
+        while True:
+            video_id = caption_q.get()
+            if video_id is None:
+                return
+            if journal is not None and video_id in journal.transcripts:
+                text = journal.transcripts[video_id]
+                segment_map[video_id] = journal.segments.get(video_id)
+            else:
+                text = get_transcript_captions(video_id, limits["captions"], store, fetcher,
+                                               segment_map)
+                if journal is not None:
+                    journal.record_transcript(video_id, text, segment_map.get(video_id))
+            with lock:
+                if text:
+                    transcript_map[video_id] = text
+                else:
+                    missing.append(video_id)
+                record_done(video_id)
+
+    threads = [threading.Thread(target=metadata_worker, daemon=True) for _ in range(workers)]
+    threads += [threading.Thread(target=caption_worker, daemon=True) for _ in range(workers)]
+    for t in threads:
+        t.start()
+
+    try:
+        for video_id in iter_shorts(channel_url, stop_at, listing):
+            video_ids.append(video_id)
+            metadata_q.put(video_id)
+            caption_q.put(video_id)
+    finally:
+        for _ in range(workers):
+            metadata_q.put(None)
+            caption_q.put(None)
+        for t in threads:
+            t.join()
 
-    total = sum(1 for v in transcript_map.values() if v != "N/A")
+    print(f"  Found {len(video_ids)} shorts")
+    metadata_list = [metadata[vid] for vid in video_ids]
+    successful = sum(1 for r in metadata_list if r["title"] != "N/A")
+    print(f"  Metadata collected: {successful}/{len(video_ids)} successful")
+    _print_error_summary(metadata_list)
+    print(f"  Captions found: {len(transcript_map)}/{len(video_ids)}")
+
+    # Keep Whisper work in channel order regardless of caption completion order
+    order = {vid: i for i, vid in enumerate(video_ids)}
+    missing.sort(key=order.get)
+    whisper_fallback(missing, transcript_map, whisper_model_name, use_whisper,
+                     cookies_browser, session, limits, journal, store,
+                     segment_map=segment_map, language=fetcher.spoken_language(),
+                     **whisper_opts)
+
+    total = sum(1 for v in transcript_map.values() if _has_transcript(v))
     print(f"  Total with transcripts: {total}/{len(video_ids)}")
-    return transcript_map
+    return video_ids, metadata_list, transcript_map
+
+
+# ---------------------------------------------------------------------------
+# refresh-stats: update views/likes of an existing dataset
+# ---------------------------------------------------------------------------
+
+def _fetch_stats(video_id, cookies_browser=None, session=None, limiter=None):
+    """get_video_stats, raising the last error instead of returning None."""
+    url = f"https://www.youtube.com/shorts/{video_id}"
+    ydl_opts = {
+        **_ydl_base_opts(cookies_browser),
+        "skip_download": True,
+        "extractor_args": {"youtube": {"skip": ["dash", "hls", "translated_subs"]}},
+    }
+    def extract():
+        with _ydl(session, "stats", ydl_opts) as ydl:
+            return ydl.extract_info(url, download=False, process=False)
+
+    info = _with_retries(extract, limiter)
+    return info.get("view_count"), info.get("like_count")
+
+
+def get_video_stats(video_id, cookies_browser=None, session=None, limiter=None):
+    """Fetch only (views, likes) for a video with the cheapest yt-dlp extraction.
+
+    Skips the DASH/HLS manifests and format processing, which are the bulk of
+    a normal extract_info call. Returns None on failure.
+    """
+    try:
+        return _fetch_stats(video_id, cookies_browser, session, limiter)
+    except Exception as e:
+        print(f"    Failed to refresh stats for {video_id}: {e}")
+        return None
+
+
+def refresh_stats(output_file, cookies_browser=None, session=None, workers=16,
+                  limits=None, cache=None):
+    """Re-fetch view_count and like_count for every row of an exported dataset.
+
+    Every other field, transcripts included, is left untouched and the file is
+    rewritten in place. Rows whose lookup fails keep their previous counts.
+    """
+    rows = load_existing(output_file)
+    if not rows:
+        print(f"\nERROR: No existing data in {output_file}")
+        sys.exit(1)
+
+    print(f"\n[{_ts()}] Refreshing views and likes for {len(rows)} shorts...")
+    limiter = (limits or build_rate_limits())["metadata"]
+
+    def fetch(row):
+        return get_video_stats(row["video_id"], cookies_browser, session, limiter)
+
+    updated = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for i, (row, stats) in enumerate(zip(rows, pool.map(fetch, rows)), 1):
+            if i % 50 == 0 or i == 1:
+                print(f"  Processing {i}/{len(rows)}...")
+            if stats is None:
+                continue
+            row["views"], row["likes"] = stats
+            updated += 1
+            if cache is not None:
+                cache.put_stats(row["video_id"], *stats)
+
+    print(f"  Stats refreshed: {updated}/{len(rows)}")
+    export_data(rows, output_file)
 
 
 # ---------------------------------------------------------------------------
 # Merge & export
 # ---------------------------------------------------------------------------
 
-def merge_data(metadata_list, transcript_map):
-    """Attach transcripts to metadata entries."""
+def merge_data(metadata_list, transcript_map, segment_map=None, transcript_errors=None):
+    """Attach transcripts (and segment timings, if given) to metadata entries.
+
+    Rows whose audio download failed get its class as "transcript_error".
+    """
     for entry in metadata_list:
         entry["transcript"] = transcript_map.get(entry["video_id"], "N/A")
+        if segment_map is not None:
+            entry["segments"] = segment_map.get(entry["video_id"])
+        if transcript_errors and entry["video_id"] in transcript_errors:
+            entry["transcript_error"] = transcript_errors[entry["video_id"]]
     return metadata_list
 
 
+def load_existing(output_file):
+    """Return the rows of a previously exported dataset, or [] if there is none."""
+    if not os.path.exists(output_file):
+        return []
+    with open(output_file, encoding="utf-8") as f:
+        return json.load(f)
+
+
 def export_data(final_data, output_file):
-    """Write the merged dataset to a JSON file."""
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(final_data, f, ensure_ascii=False, indent=2)
+    """Write the merged dataset to a JSON file.
 
-    with_transcript = sum(1 for d in final_data if d.get("transcript") and d["transcript"] != "N/A")
+    The JSON goes to a temporary file beside `output_file` that then replaces
+    it, so a crash mid-write leaves the previous export intact.
+    """
+    temp_file = f"{output_file}.tmp"
+    try:
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(final_data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, output_file)
+    except BaseException:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+
+    with_transcript = sum(1 for d in final_data if _has_transcript(d.get("transcript")))
     print(f"\n{'=' * 50}")
     print(f"Exported to {output_file}")
     print(f"Total shorts: {len(final_data)}")
@@ -299,29 +2262,135 @@ def _ts():
     return datetime.now().strftime("%H:%M:%S")
 
 
+def _print_error_summary(metadata_list):
+    """Print how many metadata lookups failed per error class."""
+    counts = {}
+    for row in metadata_list:
+        if row.get("error"):
+            counts[row["error"]] = counts.get(row["error"], 0) + 1
+    if counts:
+        print("  Failures by class: " + ", ".join(f"{k}={v}" for k, v in sorted(counts.items())))
+
+
+def _check_found(video_ids, existing, journal):
+    """Exit when listing produced nothing to do."""
+    if video_ids:
+        return
+    journal.discard()
+    if existing:
+        print("\nNo new shorts since the last run.")
+        sys.exit(0)
+    print("\nERROR: Could not find any shorts. Check the channel URL.")
+    sys.exit(1)
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
 def main():
     parser = argparse.ArgumentParser(description="Collect YouTube Shorts data (free, no API keys)")
+    parser.add_argument("command", nargs="?", default="collect",
+                        choices=["collect", "refresh-stats", "serve-whisper"],
+                        help="collect (default) builds the dataset; refresh-stats only updates "
+                             "views and likes in an existing output file; serve-whisper runs "
+                             "a local service that keeps Whisper models loaded")
     parser.add_argument("--channel", default=None, help="YouTube channel shorts URL")
     parser.add_argument("--output", default=None, help="Output JSON filename")
     parser.add_argument("--whisper-model", default="base",
                         help="Whisper model size: tiny, base, small, medium, large (default: base)")
+    parser.add_argument("--caption-languages", default="en", metavar="LANGS",
+                        help="Comma-separated caption languages, most preferred first; other "
+                             "languages are translated or taken as-is before Whisper "
+                             "(default: en)")
+    parser.add_argument("--asr-backend", default=OpenAIWhisperBackend.name,
+                        choices=sorted(ASR_BACKENDS),
+                        help="Speech recognition engine for the Whisper fallback; faster-whisper "
+                             "runs int8 CTranslate2 on CPU (default: %(default)s)")
+    parser.add_argument("--asr-workers", type=int, default=1, metavar="N",
+                        help="Whisper worker processes, each with its own model and an equal "
+                             "share of CPU threads (default: 1)")
+    parser.add_argument("--asr-batch-size", type=int, default=1, metavar="N",
+                        help="Clips decoded together per Whisper pass (openai-whisper only; "
+                             "default: 1)")
+    parser.add_argument("--vad", action="store_true",
+                        help="Trim silence before Whisper and skip clips with no speech, marking "
+                             "them \"no_speech\" (needs av; webrtcvad improves music rejection)")
+    parser.add_argument("--segments", action="store_true",
+                        help="Add per-segment timings to each row as parallel arrays "
+                             "(starts, durations, offsets into the transcript)")
+    parser.add_argument("--dedup-audio", action="store_true",
+                        help="Fingerprint downloaded audio and reuse the transcript of a "
+                             "near-identical clip transcribed before (needs av and the cache)")
     parser.add_argument("--no-whisper", action="store_true",
                         help="Skip Whisper fallback, only use YouTube captions")
+    parser.add_argument("--whisper-server", default=DEFAULT_WHISPER_SERVER, metavar="URL",
+                        help="Whisper service to use when running, else the model loads "
+                             "in-process; also the serve-whisper listen address "
+                             f"(default: {DEFAULT_WHISPER_SERVER}, '' to disable)")
     parser.add_argument("--cookies-from-browser", default=None, metavar="BROWSER",
                         help="Browser to extract cookies from (e.g. chrome, firefox, edge) "
-                             "to avoid YouTube bot detection")
+                             "to avoid YouTube bot detection; shared by yt-dlp and captions")
+    parser.add_argument("--workers", type=int, default=None, metavar="N",
+                        help="Number of concurrent metadata and caption lookups "
+                             "(default: 1, or 16 for refresh-stats)")
+    parser.add_argument("--download-workers", type=int, default=2, metavar="N",
+                        help="Threads downloading audio ahead of Whisper (default: 2)")
+    parser.add_argument("--prefetch", type=int, default=4, metavar="N",
+                        help="Max downloaded clips waiting for Whisper (default: 4)")
+    parser.add_argument("--prefetch-mb", type=int, default=256, metavar="MB",
+                        help="Disk budget for clips waiting for Whisper (default: 256)")
+    parser.add_argument("--native-audio", action="store_true",
+                        help="Keep the original opus/m4a audio stream instead of transcoding "
+                             "to MP3 before Whisper")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Overlap listing, metadata and caption fetching through bounded queues")
+    parser.add_argument("--queue-size", type=int, default=100, metavar="N",
+                        help="Max IDs waiting per pipeline stage (default: 100)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only collect shorts newer than those already in the output file")
+    parser.add_argument("--fast-metadata", action="store_true",
+                        help="When the cache knows the release date, take the title from the "
+                             "channel listing and fetch views/likes with a light stats lookup "
+                             "instead of a full yt-dlp extraction (still one request per "
+                             "short); if it fails, the listing's approximate views are kept")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted run from its checkpoint journal "
+                             "(done automatically when a non-empty journal exists)")
+    parser.add_argument("--cache-db", default=DEFAULT_CACHE_DB, metavar="PATH",
+                        help=f"SQLite metadata and transcript cache file (default: {DEFAULT_CACHE_DB})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Don't read or write the local metadata and transcript cache")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Ignore cached metadata and re-fetch everything")
+    parser.add_argument("--metadata-ttl", type=float, default=720, metavar="HOURS",
+                        help="Cache lifetime of title and release date (default: 720)")
+    parser.add_argument("--stats-ttl", type=float, default=6, metavar="HOURS",
+                        help="Cache lifetime of view and like counts (default: 6)")
+    parser.add_argument("--metadata-rate", type=float, default=DEFAULT_RATES["metadata"],
+                        metavar="RPS", help="Starting yt-dlp metadata requests/second; "
+                        "adapts to throttling (default: %(default)s)")
+    parser.add_argument("--caption-rate", type=float, default=DEFAULT_RATES["captions"],
+                        metavar="RPS", help="Starting caption requests/second (default: %(default)s)")
+    parser.add_argument("--audio-rate", type=float, default=DEFAULT_RATES["audio"],
+                        metavar="RPS", help="Starting audio download requests/second "
+                        "(default: %(default)s)")
     args = parser.parse_args()
+    if args.command == "serve-whisper":
+        serve_whisper(args.whisper_server or DEFAULT_WHISPER_SERVER,
+                      preload=[(args.asr_backend, args.whisper_model)])
+        return
+    refreshing = args.command == "refresh-stats"
+    if args.workers is None:
+        args.workers = 16 if refreshing else 1
 
     channel_url = args.channel
-    if not channel_url:
+    # refresh-stats only needs a channel to derive the default output filename
+    if not channel_url and not (refreshing and args.output):
         channel_url = input("Enter the YouTube channel shorts URL (e.g. https://www.youtube.com/@zehuman0/shorts): ").strip()
-    if not channel_url:
-        print("No channel URL provided. Exiting.")
-        sys.exit(1)
+        if not channel_url:
+            print("No channel URL provided. Exiting.")
+            sys.exit(1)
 
     # Derive a default output filename from the channel handle
     if args.output:
@@ -336,28 +2405,131 @@ def main():
 
     start = time.time()
 
-    # Step 1: List all shorts
-    video_ids = list_shorts(channel_url)
-    if not video_ids:
-        print("\nERROR: Could not find any shorts. Check the channel URL.")
-        sys.exit(1)
+    if refreshing:
+        cache = None if args.no_cache else MetadataCache(args.cache_db)
+        limits = build_rate_limits(metadata=args.metadata_rate)
+        with YdlSession(size=args.workers) as session:
+            refresh_stats(output_file, args.cookies_from_browser, session, args.workers,
+                          limits, cache)
+        if cache is not None:
+            cache.close()
+        print(f"\nCompleted in {time.time() - start:.1f} seconds")
+        return
+
+    existing = []
+    if args.incremental:
+        existing = load_existing(output_file)
+        print(f"Incremental sync: {len(existing)} shorts already in {output_file}")
+    known_ids = {row["video_id"] for row in existing}
 
     cookies_browser = args.cookies_from_browser
+    limits = build_rate_limits(args.metadata_rate, args.caption_rate, args.audio_rate)
+    cache = store = None
+    if not args.no_cache:
+        cache = MetadataCache(args.cache_db, static_ttl=args.metadata_ttl * 3600,
+                              volatile_ttl=args.stats_ttl * 3600)
+        store = TranscriptStore(args.cache_db)
+    fingerprints = None
+    if args.dedup_audio and store is not None:
+        fingerprints = FingerprintIndex(args.cache_db)
+
+    languages = [lang.strip() for lang in args.caption_languages.split(",") if lang.strip()]
+    fetcher = CaptionFetcher(max(1, args.workers), cookies_browser, languages or ["en"])
+    segment_map = {} if args.segments else None
+
+    # Every finished result is checkpointed so an interrupted run can --resume
+    journal_path = f"{output_file}.journal"
+    resume = args.resume
+    if not resume and os.path.exists(journal_path) and os.path.getsize(journal_path) > 0:
+        # Never truncate the checkpoint of an interrupted run
+        print(f"Found an unfinished run's journal {journal_path}; resuming it "
+              f"(delete the file to start over)")
+        resume = True
+    journal = Journal(journal_path, resume=resume)
+    if journal.metadata or journal.transcripts:
+        print(f"Resuming: {len(journal.metadata)} metadata and "
+              f"{len(journal.transcripts)} transcripts already done")
+
+    # Phase 2 (Whisper fallback) settings, passed through to whisper_fallback
+    transcript_errors = {}
+    whisper_opts = {
+        "whisper_server": args.whisper_server,
+        "download_workers": args.download_workers,
+        "prefetch": args.prefetch,
+        "prefetch_mb": args.prefetch_mb,
+        "native_audio": args.native_audio,
+        "asr_backend": args.asr_backend,
+        "asr_workers": args.asr_workers,
+        "asr_batch_size": args.asr_batch_size,
+        "vad": args.vad,
+        "fingerprints": fingerprints,
+        "transcript_errors": transcript_errors,
+    }
 
-    # Step 2: Get metadata
-    metadata_list = collect_metadata(video_ids, cookies_browser)
-
-    # Step 3: Get transcripts (captions first, Whisper fallback)
-    transcript_map = collect_transcripts(
-        video_ids,
-        whisper_model_name=args.whisper_model,
-        use_whisper=not args.no_whisper,
-        cookies_browser=cookies_browser,
-    )
-
-    # Step 4: Merge and export
-    final_data = merge_data(metadata_list, transcript_map)
+    # One pooled yt-dlp session shared by the metadata and audio steps
+    with YdlSession(size=max(args.workers, args.download_workers)) as session:
+        if args.pipeline:
+            # Steps 1-3 overlapped
+            video_ids, metadata_list, transcript_map = run_pipeline(
+                channel_url,
+                whisper_model_name=args.whisper_model,
+                use_whisper=not args.no_whisper,
+                **whisper_opts,
+                cookies_browser=cookies_browser,
+                session=session,
+                limits=limits,
+                workers=args.workers,
+                queue_size=args.queue_size,
+                cache=cache,
+                refresh=args.refresh,
+                stop_at=known_ids,
+                fast_metadata=args.fast_metadata,
+                journal=journal,
+                store=store,
+                fetcher=fetcher,
+                segment_map=segment_map,
+            )
+            _check_found(video_ids, existing, journal)
+        else:
+            # Step 1: List all shorts
+            listing = {} if args.fast_metadata else None
+            video_ids = list_shorts(channel_url, stop_at=known_ids, listing=listing)
+            _check_found(video_ids, existing, journal)
+
+            # Step 2: Get metadata
+            metadata_list = collect_metadata(video_ids, cookies_browser, session,
+                                             workers=args.workers, limits=limits,
+                                             cache=cache, refresh=args.refresh,
+                                             listing=listing, journal=journal)
+
+            # Step 3: Get transcripts (captions first, Whisper fallback)
+            transcript_map = collect_transcripts(
+                video_ids,
+                whisper_model_name=args.whisper_model,
+                use_whisper=not args.no_whisper,
+                **whisper_opts,
+                cookies_browser=cookies_browser,
+                session=session,
+                limits=limits,
+                journal=journal,
+                workers=args.workers,
+                store=store,
+                fetcher=fetcher,
+                segment_map=segment_map,
+            )
+
+    fetcher.close()
+    if cache is not None:
+        cache.close()
+        store.close()
+    if fingerprints is not None:
+        fingerprints.close()
+
+    # Step 4: Merge and export (new shorts first, matching the channel order)
+    final_data = merge_data(metadata_list, transcript_map, segment_map,
+                            transcript_errors) + existing
     export_data(final_data, output_file)
+    journal.discard()
 
     print(f"\nCompleted in {time.time() - start:.1f} seconds")
 